@@ -1,21 +1,63 @@
-import json
+import threading
+import orjson
 from typing import Dict, Any
 from datetime import datetime
 
 
+def _data_valida(valor: Any) -> bool:
+    """Verifica se o valor é uma data no formato AAAA-MM-DD."""
+    try:
+        datetime.strptime(valor, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
 class Settings:
     """
     Gerencia as configurações do sistema.
     Configurações são carregadas de um arquivo JSON.
     """
     
+    __slots__ = ('_config', '_nota_minima_aprovacao', '_frequencia_minima',
+                 '_max_turmas_por_aluno', '_top_n_alunos',
+                 '_data_limite_trancamento', '_cached_dict')
+    
     _instance = None
-    _config = None
+    _lock = threading.Lock()
+    
+    # Chave -> (validação, mensagem de erro); consultado em O(1) por update_config
+    _VALIDACOES = {
+        "nota_minima_aprovacao": (
+            lambda v: 0 <= v <= 10,
+            "A nota mínima de aprovação deve estar entre 0 e 10."
+        ),
+        "frequencia_minima": (
+            lambda v: 0 <= v <= 100,
+            "A frequência mínima deve estar entre 0 e 100."
+        ),
+        "data_limite_trancamento": (
+            _data_valida,
+            "A data limite de trancamento deve estar no formato AAAA-MM-DD."
+        ),
+        "max_turmas_por_aluno": (
+            lambda v: v >= 0,
+            "O máximo de turmas por aluno não pode ser negativo."
+        ),
+        "top_n_alunos": (
+            lambda v: v > 0,
+            "A quantidade de alunos no ranking deve ser maior que zero."
+        ),
+    }
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(Settings, cls).__new__(cls)
-            cls._instance._load_config()
+            with cls._lock:
+                # Segunda verificação: outra thread pode ter criado a instância
+                if cls._instance is None:
+                    instance = super(Settings, cls).__new__(cls)
+                    instance._load_config()
+                    cls._instance = instance
         return cls._instance
     
     def _load_config(self, config_file: str = "config/settings.json"):
@@ -29,56 +71,94 @@ class Settings:
         }
         
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                self._config = json.load(f)
+            with open(config_file, 'rb') as f:
+                self._config = orjson.loads(f.read())
         except FileNotFoundError:
             print(f"Arquivo de configuração {config_file} não encontrado. Usando configurações padrão.")
             self._config = default_config
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print(f"Erro ao decodificar {config_file}. Usando configurações padrão.")
             self._config = default_config
+        
+        self._config = {**default_config, **self._config}
+        self._aplicar_config()
+    
+    def _aplicar_config(self) -> None:
+        """Copia os valores de _config para atributos, evitando dict.get() a cada leitura."""
+        self._nota_minima_aprovacao = float(self._config["nota_minima_aprovacao"])
+        self._frequencia_minima = float(self._config["frequencia_minima"])
+        self._max_turmas_por_aluno = int(self._config["max_turmas_por_aluno"])
+        self._top_n_alunos = int(self._config["top_n_alunos"])
+        self._data_limite_trancamento = None
+        self._cached_dict = None
     
     @property
     def nota_minima_aprovacao(self) -> float:
         """Nota mínima para aprovação."""
-        return self._config.get("nota_minima_aprovacao", 6.0)
+        return self._nota_minima_aprovacao
     
     @property
     def frequencia_minima(self) -> float:
         """Frequência mínima para aprovação (%)."""
-        return self._config.get("frequencia_minima", 75.0)
+        return self._frequencia_minima
     
     @property
     def data_limite_trancamento(self) -> datetime:
-        """Data limite para trancamento de matrículas."""
-        data_str = self._config.get("data_limite_trancamento", "2025-12-15")
-        return datetime.strptime(data_str, "%Y-%m-%d")
+        """Data limite para trancamento de matrículas (convertida uma única vez)."""
+        if self._data_limite_trancamento is None:
+            data_str = self._config.get("data_limite_trancamento", "2025-12-15")
+            self._data_limite_trancamento = datetime.strptime(data_str, "%Y-%m-%d")
+        return self._data_limite_trancamento
     
     @property
     def max_turmas_por_aluno(self) -> int:
         """Máximo de turmas por aluno (0 para ilimitado)."""
-        return self._config.get("max_turmas_por_aluno", 6)
+        return self._max_turmas_por_aluno
     
     @property
     def top_n_alunos(self) -> int:
         """Quantidade de alunos no ranking Top N."""
-        return self._config.get("top_n_alunos", 10)
+        return self._top_n_alunos
     
     def pode_trancar(self) -> bool:
         """Verifica se ainda é possível trancar matrículas."""
         return datetime.now() <= self.data_limite_trancamento
     
     def update_config(self, new_config: Dict[str, Any]) -> None:
-        """Atualiza configurações."""
+        """
+        Atualiza configurações.
+        
+        Args:
+            new_config: Chaves e novos valores das configurações.
+        
+        Raises:
+            ValueError: Se algum valor for inválido (nada é alterado nesse caso).
+        """
+        for chave, valor in new_config.items():
+            validacao = self._VALIDACOES.get(chave)
+            if validacao is None:
+                continue
+            valido, mensagem = validacao
+            try:
+                ok = valido(valor)
+            except TypeError:
+                ok = False
+            if not ok:
+                raise ValueError(mensagem)
+        
         self._config.update(new_config)
+        self._aplicar_config()
     
     def to_dict(self) -> Dict[str, Any]:
         """Retorna configurações como dicionário."""
-        return {
-            "nota_minima_aprovacao": self.nota_minima_aprovacao,
-            "frequencia_minima": self.frequencia_minima,
-            "data_limite_trancamento": self.data_limite_trancamento.strftime("%Y-%m-%d"),
-            "max_turmas_por_aluno": self.max_turmas_por_aluno,
-            "top_n_alunos": self.top_n_alunos,
-            "pode_trancar": self.pode_trancar()
-        }
\ No newline at end of file
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "nota_minima_aprovacao": self.nota_minima_aprovacao,
+                "frequencia_minima": self.frequencia_minima,
+                "data_limite_trancamento": self.data_limite_trancamento.strftime("%Y-%m-%d"),
+                "max_turmas_por_aluno": self.max_turmas_por_aluno,
+                "top_n_alunos": self.top_n_alunos
+            }
+        
+        # pode_trancar depende da data atual, então não entra no cache
+        return {**self._cached_dict, "pode_trancar": self.pode_trancar()}
\ No newline at end of file
@@ -1,30 +1,150 @@
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 
 class SQLiteConnection:
-    """Gerencia a conexão SQLite e fornece (connection, cursor)."""
+    """
+    Gerencia as conexões SQLite e fornece (connection, cursor).
+
+    Mantém uma única conexão de escrita, protegida por lock, e um pool de
+    conexões somente leitura (WAL permite leituras concorrentes à escrita).
+    """
     _connection = None
     _cursor = None
     _database_file = "banco_dados.db"
+    _pragmas = """
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -64000;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA foreign_keys = ON;
+    """
+    _pool_size = min(8, os.cpu_count() or 1)
+    # Cache de statements preparados por conexão (padrão do sqlite3: 128).
+    # Os repositórios somam dezenas de SQLs fixos além dos UPDATE/IN montados
+    # dinamicamente; com folga, os fixos não são despejados do LRU.
+    _cached_statements = 256
+    _readers = None
+    _all_readers = []
+    _write_lock = threading.RLock()
+    _pool_lock = threading.Lock()
+    _local = threading.local()
 
     @classmethod
     def get_connection(cls):
-        """Retorna uma tupla (connection, cursor). Cria a conexão na primeira chamada."""
+        """Retorna a tupla (connection, cursor) de escrita. Cria a conexão na primeira chamada."""
         if cls._connection is None:
-            cls._connection = sqlite3.connect(cls._database_file, check_same_thread=False)
-            cls._connection.row_factory = sqlite3.Row
-            cls._connection.execute("PRAGMA foreign_keys = ON;")
-            cls._cursor = cls._connection.cursor()
+            with cls._write_lock:
+                if cls._connection is None:
+                    connection = sqlite3.connect(
+                        cls._database_file,
+                        check_same_thread=False,
+                        cached_statements=cls._cached_statements,
+                        # Transações controladas explicitamente em acquire_write
+                        isolation_level=None
+                    )
+                    connection.row_factory = sqlite3.Row
+                    # Aplicado em toda conexão nova (só o journal_mode persiste no arquivo)
+                    connection.executescript(cls._pragmas)
+                    cls._cursor = connection.cursor()
+                    cls._connection = connection
 
         return cls._connection, cls._cursor
 
+    @classmethod
+    def _open_reader(cls):
+        """Abre uma conexão somente leitura sobre o mesmo arquivo."""
+        connection = sqlite3.connect(
+            f"file:{cls._database_file}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=cls._cached_statements
+        )
+        connection.row_factory = sqlite3.Row
+        connection.executescript(cls._pragmas)
+        return connection
+
+    @classmethod
+    def init_pool(cls):
+        """Abre a conexão de escrita e o pool de leitores (idempotente)."""
+        # A conexão de escrita cria o arquivo e ativa o WAL antes dos leitores
+        cls.get_connection()
+        if cls._readers is not None:
+            return
+
+        with cls._pool_lock:
+            if cls._readers is None:
+                readers = queue.Queue(maxsize=cls._pool_size)
+                for _ in range(cls._pool_size):
+                    connection = cls._open_reader()
+                    cls._all_readers.append(connection)
+                    readers.put(connection)
+                cls._readers = readers
+
+    @classmethod
+    @contextmanager
+    def acquire_read(cls):
+        """
+        Empresta uma conexão de leitura do pool como (connection, cursor).
+        Chamadas aninhadas na mesma thread reutilizam a conexão já emprestada.
+        """
+        atual = getattr(cls._local, "reader", None)
+        if atual is not None:
+            yield atual
+            return
+
+        cls.init_pool()
+        connection = cls._readers.get()
+        cursor = connection.cursor()
+        cls._local.reader = (connection, cursor)
+        try:
+            yield connection, cursor
+        finally:
+            cls._local.reader = None
+            cursor.close()
+            cls._readers.put(connection)
+
+    @classmethod
+    @contextmanager
+    def acquire_write(cls):
+        """
+        Retorna a conexão de escrita como (connection, cursor), com acesso exclusivo.
+
+        O bloco roda dentro de uma transação explícita (BEGIN IMMEDIATE), confirmada
+        na saída ou desfeita em caso de exceção. commit()/rollback() feitos pelo
+        próprio bloco encerram a transação antes; chamadas aninhadas reutilizam a
+        transação do bloco externo.
+        """
+        with cls._write_lock:
+            connection, cursor = cls.get_connection()
+            if connection.in_transaction:
+                yield connection, cursor
+                return
+
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection, cursor
+            except BaseException:
+                if connection.in_transaction:
+                    connection.rollback()
+                raise
+            if connection.in_transaction:
+                connection.commit()
+
     @classmethod
     def close_connection(cls):
-        """Fecha a conexão, se aberta."""
+        """Fecha as conexões abertas (escrita e pool de leitura)."""
+        with cls._pool_lock:
+            for connection in cls._all_readers:
+                connection.close()
+            cls._all_readers = []
+            cls._readers = None
         if cls._cursor:
             cls._cursor.close()
             cls._cursor = None
         if cls._connection:
             cls._connection.close()
             cls._connection = None
-
-
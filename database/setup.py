@@ -1,122 +1,150 @@
 from database.connection import SQLiteConnection
 
 
+ALUNO_TABLE = """
+CREATE TABLE IF NOT EXISTS aluno (
+    matricula TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    email TEXT NOT NULL,
+    cr REAL
+);
+"""
+
+CURSO_TABLE = """
+CREATE TABLE IF NOT EXISTS curso (
+    codigo TEXT PRIMARY KEY,
+    nome TEXT NOT NULL,
+    carga_horaria INTEGER,
+    ementa TEXT
+);
+"""
+
+CURSO_PREREQUISITO_TABLE = """
+CREATE TABLE IF NOT EXISTS curso_prerequisito (
+    curso_codigo TEXT NOT NULL,
+    prerequisito_codigo TEXT NOT NULL,
+    FOREIGN KEY (curso_codigo) REFERENCES curso(codigo),
+    FOREIGN KEY (prerequisito_codigo) REFERENCES curso(codigo)
+);
+"""
+
+TURMA_TABLE = """
+CREATE TABLE IF NOT EXISTS turma (
+    id TEXT PRIMARY KEY ,
+    periodo TEXT,
+    vagas INTEGER,
+    curso_codigo TEXT,
+    local TEXT,
+    status BOOLEAN,
+    FOREIGN KEY (curso_codigo) REFERENCES curso(codigo)
+);
+"""
+
+HORARIO_TURMA_TABLE = """
+CREATE TABLE IF NOT EXISTS horario_turma (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    turma_id TEXT NOT NULL,
+    dia TEXT,
+    intervalo TEXT,
+    FOREIGN KEY (turma_id) REFERENCES turma(id)
+);
+"""
+
+MATRICULA_TABLE = """
+CREATE TABLE IF NOT EXISTS matricula (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    aluno_matricula TEXT NOT NULL,
+    turma_id TEXT NOT NULL,
+    nota REAL,
+    frequencia REAL,
+    situacao TEXT NOT NULL DEFAULT 'CURSANDO',
+    data_matricula TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    data_conclusao TIMESTAMP,
+    FOREIGN KEY(aluno_matricula) REFERENCES aluno(matricula) ON DELETE CASCADE,
+    FOREIGN KEY(turma_id) REFERENCES turma(id) ON DELETE CASCADE,
+    UNIQUE(aluno_matricula, turma_id)
+);
+"""
+
+HISTORICO_ALUNO_TABLE = """
+CREATE TABLE IF NOT EXISTS historico_aluno (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    aluno_matricula TEXT NOT NULL,
+    codigo_curso TEXT NOT NULL,
+    nota REAL NOT NULL,
+    frequencia REAL NOT NULL,
+    carga_horaria INTEGER NOT NULL,
+    situacao TEXT NOT NULL,
+    semestre TEXT,
+    data_registro TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY(aluno_matricula) REFERENCES aluno(matricula) ON DELETE CASCADE,
+    FOREIGN KEY(codigo_curso) REFERENCES curso(codigo) ON DELETE SET NULL
+);
+"""
+
+# Índices compostos começando por aluno_matricula (substituem o índice só
+# de matrícula): o de situação cobre o cálculo do CR sem ler a tabela, e o de
+# curso atende às buscas por (aluno, curso)
+HISTORICO_INDICES = """
+DROP INDEX IF EXISTS idx_historico_aluno_matricula;
+
+CREATE INDEX IF NOT EXISTS idx_historico_aluno_situacao 
+ON historico_aluno(aluno_matricula, situacao, carga_horaria, nota);
+
+CREATE INDEX IF NOT EXISTS idx_historico_aluno_curso 
+ON historico_aluno(aluno_matricula, codigo_curso, situacao);
+
+CREATE INDEX IF NOT EXISTS idx_historico_codigo_curso 
+ON historico_aluno(codigo_curso);
+
+CREATE INDEX IF NOT EXISTS idx_historico_situacao 
+ON historico_aluno(situacao);
+"""
+
+# Versão do esquema gravada em PRAGMA user_version; incrementar ao alterar o DDL
+SCHEMA_VERSION = 2
+
+# Esquema completo enviado ao SQLite em uma única chamada (executescript)
+SCHEMA_DDL = "\n".join([
+    ALUNO_TABLE,
+    CURSO_TABLE,
+    CURSO_PREREQUISITO_TABLE,
+    TURMA_TABLE,
+    HORARIO_TURMA_TABLE,
+    MATRICULA_TABLE,
+    HISTORICO_ALUNO_TABLE,
+    HISTORICO_INDICES,
+])
+
+
 def create_tables():
-    connection, cursor = SQLiteConnection.get_connection()
-
-    aluno_table = """
-    CREATE TABLE IF NOT EXISTS aluno (
-        matricula TEXT PRIMARY KEY,
-        nome TEXT NOT NULL,
-        email TEXT NOT NULL,
-        cr REAL
-    );
-    """
-
-    curso_table = """
-    CREATE TABLE IF NOT EXISTS curso (
-        codigo TEXT PRIMARY KEY,
-        nome TEXT NOT NULL,
-        carga_horaria INTEGER,
-        ementa TEXT
-    );
-    """
-
-    curso_prerequisito_table = """
-    CREATE TABLE IF NOT EXISTS curso_prerequisito (
-        curso_codigo TEXT NOT NULL,
-        prerequisito_codigo TEXT NOT NULL,
-        FOREIGN KEY (curso_codigo) REFERENCES curso(codigo),
-        FOREIGN KEY (prerequisito_codigo) REFERENCES curso(codigo)
-    );
-    """
-
-    turma_table = """
-    CREATE TABLE IF NOT EXISTS turma (
-        id TEXT PRIMARY KEY ,
-        periodo TEXT,
-        vagas INTEGER,
-        curso_codigo TEXT,
-        local TEXT,
-        status BOOLEAN,
-        FOREIGN KEY (curso_codigo) REFERENCES curso(codigo)
-    );
-    """
-
-    horario_turma_table = """
-    CREATE TABLE IF NOT EXISTS horario_turma (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        turma_id TEXT NOT NULL,
-        dia TEXT,
-        intervalo TEXT,
-        FOREIGN KEY (turma_id) REFERENCES turma(id)
-    );
-    """
-
-    matricula_table = """
-        CREATE TABLE IF NOT EXISTS matricula (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            aluno_matricula TEXT NOT NULL,
-            turma_id TEXT NOT NULL,
-            nota REAL,
-            frequencia REAL,
-            situacao TEXT NOT NULL DEFAULT 'CURSANDO',
-            data_matricula TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            data_conclusao TIMESTAMP,
-            FOREIGN KEY(aluno_matricula) REFERENCES aluno(matricula) ON DELETE CASCADE,
-            FOREIGN KEY(turma_id) REFERENCES turma(id) ON DELETE CASCADE,
-            UNIQUE(aluno_matricula, turma_id)
-        );
-    """
-    historico_aluno_table = """
-    CREATE TABLE IF NOT EXISTS historico_aluno (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        aluno_matricula TEXT NOT NULL,
-        codigo_curso TEXT NOT NULL,
-        nota REAL NOT NULL,
-        frequencia REAL NOT NULL,
-        carga_horaria INTEGER NOT NULL,
-        situacao TEXT NOT NULL,
-        semestre TEXT,
-        data_registro TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY(aluno_matricula) REFERENCES aluno(matricula) ON DELETE CASCADE,
-        FOREIGN KEY(codigo_curso) REFERENCES curso(codigo) ON DELETE SET NULL
-    );
-    """
-
-    historico_indices = """
-    CREATE INDEX IF NOT EXISTS idx_historico_aluno_matricula 
-    ON historico_aluno(aluno_matricula);
-    
-    CREATE INDEX IF NOT EXISTS idx_historico_codigo_curso 
-    ON historico_aluno(codigo_curso);
-    
-    CREATE INDEX IF NOT EXISTS idx_historico_situacao 
-    ON historico_aluno(situacao);
-    """
-
-    try:
-        cursor.execute(aluno_table)
-        cursor.execute(curso_table)
-        cursor.execute(curso_prerequisito_table)
-        cursor.execute(turma_table)
-        cursor.execute(horario_turma_table)
-        cursor.execute(matricula_table)
-        cursor.execute(historico_aluno_table)
-        
-        for index_sql in historico_indices.split(';'):
-            if index_sql.strip():
-                cursor.execute(index_sql)
+    with SQLiteConnection.acquire_write() as (connection, cursor):
+        try:
+            # Banco já na versão atual: nada a criar
+            versao = cursor.execute("PRAGMA user_version;").fetchone()[0]
+            if versao == SCHEMA_VERSION:
+                return True
+
+            # executescript faz COMMIT implícito antes de executar o script;
+            # o DDL e a versão são gravados em uma única transação
+            cursor.executescript(
+                "BEGIN;\n"
+                f"{SCHEMA_DDL}\n"
+                f"PRAGMA user_version = {SCHEMA_VERSION};\n"
+                "COMMIT;\n"
+                # Atualiza as estatísticas do planejador para os índices novos
+                "PRAGMA optimize;"
+            )
+            print("\nTabelas criadas com sucesso!")
+            return True
         
-        connection.commit()
-        print("\nTabelas criadas com sucesso!")
-        return True
-    
-    except Exception as e:
-        print(f"\n@@@ Erro ao criar as tabelas: {e} @@@")
-        return False
-    
-    finally:
-        SQLiteConnection.close_connection()
-
-create_tables()
\ No newline at end of file
+        except Exception as e:
+            if connection.in_transaction:
+                connection.rollback()
+            print(f"\n@@@ Erro ao criar as tabelas: {e} @@@")
+            return False
+
+
+if __name__ == "__main__":
+    create_tables()
+    SQLiteConnection.close_connection()
@@ -1,10 +1,30 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from database.connection import SQLiteConnection
+from database.setup import create_tables
 from routers import aluno_router
 from routers import curso_router
 from routers import turma_router
 from routers import matricula_router
 
-app = FastAPI(title="Gerenciador de Cursos e Alunos")
+@asynccontextmanager
+async def ciclo_de_vida(app: FastAPI):
+    """Abre as conexões antes da primeira requisição e as fecha no desligamento."""
+    # Conexão de escrita e pool de leitura
+    SQLiteConnection.init_pool()
+    # Cria o esquema em bancos novos; em partidas a quente só lê o user_version
+    create_tables()
+    try:
+        yield
+    finally:
+        SQLiteConnection.close_connection()
+
+app = FastAPI(
+    title="Gerenciador de Cursos e Alunos",
+    default_response_class=ORJSONResponse,
+    lifespan=ciclo_de_vida
+)
 
 @app.get("/")
 def home():
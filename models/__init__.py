@@ -1 +1 @@
-from .aluno import Aluno
\ No newline at end of file
+from .aluno import Aluno, Situacao
@@ -1,12 +1,96 @@
 # models/aluno.py
+from array import array
+from collections.abc import Sequence
 from models.pessoa import Pessoa
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+from enum import IntEnum
+from itertools import compress
+from operator import eq, itemgetter, mul
+from time import localtime, strftime
+from types import MappingProxyType
+
+__all__ = ['Aluno', 'Situacao']
+
+
+class Situacao(IntEnum):
+    """Situação de um registro do histórico. O texto (nome) só é usado na fronteira com o banco/API."""
+    APROVADO = 0
+    REPROVADO_POR_NOTA = 1
+    REPROVADO_POR_FREQUENCIA = 2
+    CURSANDO = 3
+    TRANCADO = 4
+    DESISTENTE = 5
+
+
+# Texto da situação -> código; situações desconhecidas viram _SITUACAO_INVALIDA
+_CODIGO_SITUACAO = {situacao.name: situacao for situacao in Situacao}
+_SITUACAO_INVALIDA = len(Situacao)
+_MENSAGEM_SITUACAO_INVALIDA = f"Situação inválida. Use: {', '.join(_CODIGO_SITUACAO)}"
+# Bits das situações que entram no cálculo do CR
+_MASCARA_CR = (1 << Situacao.APROVADO) | (1 << Situacao.REPROVADO_POR_NOTA)
+# Bits das situações de reprovação (estatísticas)
+_MASCARA_REPROVADO = (1 << Situacao.REPROVADO_POR_NOTA) | (1 << Situacao.REPROVADO_POR_FREQUENCIA)
+# Projeção do código do curso de um registro (feita em C)
+_codigo_curso = itemgetter('codigo_curso')
+# Formato de data_registro nos registros do histórico
+_FORMATO_DATA_REGISTRO = "%Y-%m-%d %H:%M:%S"
+
+
+def _agora() -> str:
+    """Data/hora local atual no formato de data_registro (sem criar um datetime)."""
+    return strftime(_FORMATO_DATA_REGISTRO, localtime())
+
+
+def _peso_cr(situacao: int, carga: int) -> int:
+    """Carga horária com que o registro entra no CR (0 se não for considerado)."""
+    # Considera apenas disciplinas concluídas (não "CURSANDO")
+    return carga if (1 << situacao) & _MASCARA_CR and carga > 0 else 0
+
+
+class _HistoricoView(Sequence):
+    """
+    Visão somente leitura sobre a lista de registros do histórico (não copia).
+    Cada registro é entregue como MappingProxyType, preservando os índices internos do aluno.
+    """
+
+    __slots__ = ('_registros',)
+
+    def __init__(self, registros: List[Dict[str, Any]]):
+        self._registros = registros
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return tuple(map(MappingProxyType, self._registros[indice]))
+        return MappingProxyType(self._registros[indice])
+
+    def __len__(self):
+        return len(self._registros)
+
+    def __iter__(self):
+        return map(MappingProxyType, self._registros)
+
+    def __eq__(self, outro):
+        # Igual a qualquer sequência com os mesmos registros (ex.: historico == [])
+        if isinstance(outro, _HistoricoView):
+            return self._registros == outro._registros
+        if isinstance(outro, Sequence) and not isinstance(outro, (str, bytes)):
+            registros = self._registros
+            return len(registros) == len(outro) and all(map(eq, registros, outro))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._registros)
 
 
 class Aluno(Pessoa):
     """Representa um aluno e operações relativas ao seu histórico e CR."""
 
+    __slots__ = ('_matricula', '_historico', '_cr', '_notas', '_cargas', '_situacoes',
+                 '_pesos', '_indice', '_aprovados', '_soma_ponderada', '_total_carga',
+                 '_revisao', '_cache_estatisticas', '_cache_aprovados')
+
     def __init__(self, matricula: str, nome: str, email: str, cr: float = 0.0, 
                  historico: Optional[List[Dict[str, Any]]] = None):
         """
@@ -30,6 +114,25 @@ class Aluno(Pessoa):
         self._matricula = matricula.strip()
         self._historico: List[Dict[str, Any]] = historico if historico else []
         self._cr = float(cr)
+        # Colunas paralelas ao histórico (mesmo índice) com os campos usados no CR
+        self._notas = array('d')
+        self._cargas = array('i')
+        self._situacoes = array('b')
+        # Carga que entra no CR (0 quando a situação não conta)
+        self._pesos = array('i')
+        # Posição de cada código de curso no histórico (primeira ocorrência)
+        self._indice: Dict[str, int] = {}
+        # Índice dos códigos de cursos aprovados, para consulta em O(1)
+        self._aprovados: set = set()
+        self._reconstruir_colunas()
+        # Acumuladores do CR, atualizados em O(1) a cada novo registro
+        self._soma_ponderada = 0.0
+        self._total_carga = 0
+        self._recalcular_acumuladores()
+        # Revisão do histórico/CR; os caches guardam (revisão, valor)
+        self._revisao = 0
+        self._cache_estatisticas = None
+        self._cache_aprovados = None
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Aluno':
@@ -57,45 +160,89 @@ class Aluno(Pessoa):
 
     @property
     def historico(self):
-        """Retorna uma cópia do histórico para evitar modificação externa."""
-        return self._historico.copy()
+        """Retorna uma visão somente leitura do histórico, sem copiar a lista."""
+        return _HistoricoView(self._historico)
 
     @property
     def cr(self):
         """Retorna o CR atual (Coeficiente de Rendimento)."""
         return self._cr
 
+    @property
+    def chave_ordenacao(self):
+        """Chave de ordenação: CR decrescente e, no empate, nome em ordem alfabética."""
+        return (-self._cr, self._nome)
+
+    def _registrar_colunas(self, registro: Dict[str, Any]) -> None:
+        """Acrescenta às colunas a nota, a carga horária e a situação do registro."""
+        self._indice.setdefault(registro.get('codigo_curso'), len(self._notas))
+        # float()/int() aceitam também os valores em texto que o histórico
+        # (Dict[str, Any]) pode trazer; array('i') rejeitaria float na carga
+        self._notas.append(float(registro.get('nota', 0)))
+        carga = int(registro.get('carga_horaria', 0))
+        self._cargas.append(carga)
+        situacao = _CODIGO_SITUACAO.get(registro.get('situacao', '').upper(), _SITUACAO_INVALIDA)
+        self._situacoes.append(situacao)
+        self._pesos.append(_peso_cr(situacao, carga))
+        if situacao == Situacao.APROVADO:
+            self._aprovados.add(registro.get('codigo_curso'))
+
+    def _reconstruir_colunas(self) -> None:
+        """Reconstrói as colunas a partir da lista de registros do histórico."""
+        self._notas = array('d')
+        self._cargas = array('i')
+        self._situacoes = array('b')
+        self._pesos = array('i')
+        self._indice = {}
+        self._aprovados = set()
+        registrar = self._registrar_colunas
+        for registro in self._historico:
+            registrar(registro)
+
+    def _recalcular_acumuladores(self) -> None:
+        """Refaz a soma ponderada e a carga total a partir das colunas do histórico."""
+        # Reduções em C: registros fora do CR têm peso 0 e não alteram as somas
+        pesos = self._pesos
+        self._soma_ponderada = sum(map(mul, self._notas, pesos))
+        self._total_carga = sum(pesos)
+
     def calcular_cr(self) -> float:
         """
-        Calcula e atualiza o Coeficiente de Rendimento (CR) do aluno.
+        Recalcula do zero o Coeficiente de Rendimento (CR) do aluno.
         
         O CR é a média ponderada das notas pela carga horária.
         Considera apenas disciplinas com situação "APROVADO" ou "REPROVADO_POR_NOTA".
+        Percorre todo o histórico; inclusões, alterações e remoções isoladas
+        atualizam o CR de forma incremental (_ajustar_cr).
         
         Returns:
             float: O coeficiente de rendimento calculado.
         """
-        if not self._historico:
-            self._cr = 0.0
-            return self._cr
-        
-        total_carga = 0
-        soma_ponderada = 0.0
-        
-        for registro in self._historico:
-            # Considera apenas disciplinas concluídas (não "CURSANDO")
-            situacao = registro.get('situacao', '').upper()
-            if situacao in ['APROVADO', 'REPROVADO_POR_NOTA']:
-                nota = float(registro.get('nota', 0))
-                carga = int(registro.get('carga_horaria', 0))
-                
-                if carga > 0:
-                    soma_ponderada += nota * carga
-                    total_carga += carga
-        
-        self._cr = round(soma_ponderada / total_carga, 2) if total_carga > 0 else 0.0
+        self._recalcular_acumuladores()
+        total_carga = self._total_carga
+        self._cr = round(self._soma_ponderada / total_carga, 2) if total_carga > 0 else 0.0
+        self._revisao += 1
         return self._cr
 
+    def _ajustar_cr(self, soma: float, carga: int) -> None:
+        """
+        Aplica aos acumuladores a variação de uma contribuição e atualiza o CR em O(1).
+        
+        Args:
+            soma: Variação de Σ nota * carga (negativa ao retirar um registro).
+            carga: Variação de Σ carga (negativa ao retirar um registro).
+        """
+        self._soma_ponderada += soma
+        self._total_carga += carga
+        total_carga = self._total_carga
+        if total_carga > 0:
+            self._cr = round(self._soma_ponderada / total_carga, 2)
+        else:
+            # Sem carga no CR: zera a soma para não acumular resíduo de ponto flutuante
+            self._soma_ponderada = 0.0
+            self._cr = 0.0
+        self._revisao += 1
+
     def adicionar_ao_historico(self, codigo_curso: str, nota: float, frequencia: float, 
                                carga_horaria: int, situacao: str, semestre: Optional[str] = None) -> None:
         """
@@ -112,6 +259,60 @@ class Aluno(Pessoa):
         Raises:
             ValueError: Se os valores estiverem fora dos limites permitidos.
         """
+        registro = self._novo_registro(codigo_curso, nota, frequencia, carga_horaria,
+                                       situacao, semestre, _agora())
+        
+        self._historico.append(registro)
+        self._registrar_colunas(registro)
+        peso = self._pesos[-1]
+        self._ajustar_cr(registro['nota'] * peso, peso)
+        return registro
+
+    def adicionar_ao_historico_lote(self, registros: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Adiciona vários registros ao histórico, recalculando o CR uma única vez.
+        
+        Todos os registros são validados antes de qualquer inclusão: se um
+        deles for inválido, o histórico permanece inalterado.
+        
+        Args:
+            registros: Dicionários com codigo_curso, nota, frequencia,
+                carga_horaria, situacao e semestre (opcional).
+        
+        Returns:
+            Lista dos registros adicionados.
+        
+        Raises:
+            ValueError: Se algum registro for inválido ou repetir um curso.
+        """
+        agora = _agora()
+        novos = []
+        codigos = set()
+        for dados in registros:
+            try:
+                codigo_curso = dados['codigo_curso']
+                campos = (dados['nota'], dados['frequencia'], dados['carga_horaria'], dados['situacao'])
+            except KeyError as e:
+                raise ValueError(f"Campo obrigatório ausente no histórico: {e}")
+            if codigo_curso in codigos:
+                raise ValueError(f"Curso {codigo_curso} já está no histórico do aluno.")
+            codigos.add(codigo_curso)
+            novos.append(self._novo_registro(codigo_curso, *campos, dados.get('semestre'), agora))
+        
+        for registro in novos:
+            self._historico.append(registro)
+            self._registrar_colunas(registro)
+        self.calcular_cr()
+        return novos
+
+    def _novo_registro(self, codigo_curso: str, nota: float, frequencia: float, carga_horaria: int,
+                       situacao: str, semestre: Optional[str], data_registro: str) -> Dict[str, Any]:
+        """
+        Valida os dados e monta um registro do histórico (sem incluí-lo).
+        
+        Raises:
+            ValueError: Se os valores estiverem fora dos limites ou o curso já estiver no histórico.
+        """
         # Validações
         if not 0 <= nota <= 10:
             raise ValueError("Nota deve estar entre 0 e 10.")
@@ -120,32 +321,23 @@ class Aluno(Pessoa):
         if carga_horaria <= 0:
             raise ValueError("Carga horária deve ser maior que zero.")
         
-        situacoes_validas = ['APROVADO', 'REPROVADO_POR_NOTA', 
-                            'REPROVADO_POR_FREQUENCIA', 'CURSANDO', 
-                            'TRANCADO', 'DESISTENTE']
-        
         situacao_upper = situacao.upper()
-        if situacao_upper not in situacoes_validas:
-            raise ValueError(f"Situação inválida. Use: {', '.join(situacoes_validas)}")
+        if situacao_upper not in _CODIGO_SITUACAO:
+            raise ValueError(_MENSAGEM_SITUACAO_INVALIDA)
         
         # Verificar se curso já está no histórico
-        for registro in self._historico:
-            if registro.get('codigo_curso') == codigo_curso:
-                raise ValueError(f"Curso {codigo_curso} já está no histórico do aluno.")
+        if codigo_curso in self._indice:
+            raise ValueError(f"Curso {codigo_curso} já está no histórico do aluno.")
         
-        registro = {
+        return {
             'codigo_curso': codigo_curso,
             'nota': float(nota),
             'frequencia': float(frequencia),
             'carga_horaria': int(carga_horaria),
             'situacao': situacao_upper,
             'semestre': semestre,
-            'data_registro': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            'data_registro': data_registro
         }
-        
-        self._historico.append(registro)
-        self.calcular_cr()
-        return registro
 
     def atualizar_historico(self, codigo_curso: str, **kwargs) -> bool:
         """
@@ -158,24 +350,53 @@ class Aluno(Pessoa):
         Returns:
             True se atualizado, False se curso não encontrado.
         """
-        for registro in self._historico:
-            if registro.get('codigo_curso') == codigo_curso:
-                # Atualizar apenas campos válidos
-                campos_validos = ['nota', 'frequencia', 'situacao', 'semestre']
-                for campo, valor in kwargs.items():
-                    if campo in campos_validos:
-                        if campo == 'nota' and not (0 <= float(valor) <= 10):
-                            raise ValueError("Nota deve estar entre 0 e 10.")
-                        elif campo == 'frequencia' and not (0 <= float(valor) <= 100):
-                            raise ValueError("Frequência deve estar entre 0 e 100.")
-                        
-                        registro[campo] = valor
+        i = self._indice.get(codigo_curso)
+        if i is None:
+            return False
+        
+        registro = self._historico[i]
+        # Atualizar apenas campos válidos
+        campos_validos = ['nota', 'frequencia', 'situacao', 'semestre']
+        for campo, valor in kwargs.items():
+            if campo in campos_validos:
+                if campo == 'nota' and not (0 <= float(valor) <= 10):
+                    raise ValueError("Nota deve estar entre 0 e 10.")
+                elif campo == 'frequencia' and not (0 <= float(valor) <= 100):
+                    raise ValueError("Frequência deve estar entre 0 e 100.")
                 
-                registro['data_registro'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.calcular_cr()
-                return True
+                registro[campo] = valor
+        
+        registro['data_registro'] = _agora()
+        contribuicao_anterior = self._notas[i] * self._pesos[i]
+        peso_anterior = self._pesos[i]
+        self._notas[i] = float(registro.get('nota', 0))
+        self._situacoes[i] = _CODIGO_SITUACAO.get(
+            registro.get('situacao', '').upper(), _SITUACAO_INVALIDA
+        )
+        self._pesos[i] = _peso_cr(self._situacoes[i], self._cargas[i])
+        if self._situacoes[i] == Situacao.APROVADO:
+            self._aprovados.add(codigo_curso)
+        elif not self._aprovado_a_partir(codigo_curso, i + 1):
+            self._aprovados.discard(codigo_curso)
+        self._ajustar_cr(self._notas[i] * self._pesos[i] - contribuicao_anterior,
+                         self._pesos[i] - peso_anterior)
+        return True
+
+    def _aprovado_a_partir(self, codigo_curso: str, inicio: int) -> bool:
+        """
+        Indica se algum registro do curso a partir da posição `inicio` está APROVADO.
         
-        return False
+        Históricos carregados do banco podem repetir o código; `_indice` aponta
+        para a primeira ocorrência, então as demais estão sempre depois dela.
+        """
+        if codigo_curso not in self._aprovados:
+            return False
+        historico = self._historico
+        situacoes = self._situacoes
+        return any(
+            situacoes[j] == Situacao.APROVADO and historico[j].get('codigo_curso') == codigo_curso
+            for j in range(inicio, len(historico))
+        )
 
     def remover_do_historico(self, codigo_curso: str) -> bool:
         """
@@ -187,13 +408,29 @@ class Aluno(Pessoa):
         Returns:
             True se removido, False se não encontrado.
         """
-        for i, registro in enumerate(self._historico):
-            if registro.get('codigo_curso') == codigo_curso:
-                self._historico.pop(i)
-                self.calcular_cr()
-                return True
-        
-        return False
+        i = self._indice.pop(codigo_curso, None)
+        if i is None:
+            return False
+        
+        self._historico.pop(i)
+        nota = self._notas.pop(i)
+        self._cargas.pop(i)
+        self._situacoes.pop(i)
+        peso = self._pesos.pop(i)
+        if not self._aprovado_a_partir(codigo_curso, i):
+            self._aprovados.discard(codigo_curso)
+        
+        # Registros seguintes recuam uma posição; só a primeira ocorrência de
+        # cada código (posição antiga j + 1, ou sem entrada) é reindexada
+        for j in range(i, len(self._historico)):
+            codigo = self._historico[j].get('codigo_curso')
+            posicao = self._indice.get(codigo)
+            if posicao is None or posicao == j + 1:
+                self._indice[codigo] = j
+        
+        # Registro fora do CR tem peso 0: o CR não muda, só a revisão do histórico
+        self._ajustar_cr(-nota * peso, -peso)
+        return True
 
     def carregar_historico(self, historico: List[Dict[str, Any]]) -> None:
         """
@@ -203,6 +440,8 @@ class Aluno(Pessoa):
             historico: Lista de registros históricos.
         """
         self._historico = []
+        # Mesmo instante para todos os registros sem data_registro
+        agora = _agora()
         for registro in historico:
             self._historico.append({
                 'codigo_curso': registro['codigo_curso'],
@@ -211,9 +450,9 @@ class Aluno(Pessoa):
                 'carga_horaria': int(registro.get('carga_horaria', 0)),
                 'situacao': registro.get('situacao', 'CURSANDO').upper(),
                 'semestre': registro.get('semestre'),
-                'data_registro': registro.get('data_registro', 
-                                            datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                'data_registro': registro.get('data_registro', agora)
             })
+        self._reconstruir_colunas()
         self.calcular_cr()
 
     def curso_aprovado(self, codigo_curso: str) -> bool:
@@ -226,11 +465,19 @@ class Aluno(Pessoa):
         Returns:
             bool: True se o aluno foi aprovado no curso.
         """
-        for registro in self._historico:
-            if (registro.get('codigo_curso') == codigo_curso and 
-                registro.get('situacao') == 'APROVADO'):
-                return True
-        return False
+        return codigo_curso in self._aprovados
+
+    def curso_no_historico(self, codigo_curso: str) -> bool:
+        """
+        Verifica se o curso já consta no histórico do aluno (em qualquer situação).
+        
+        Args:
+            codigo_curso (str): Código do curso a verificar.
+        
+        Returns:
+            bool: True se houver registro do curso no histórico.
+        """
+        return codigo_curso in self._indice
 
     def get_cursos_cursados(self) -> List[str]:
         """
@@ -239,32 +486,71 @@ class Aluno(Pessoa):
         Returns:
             Lista de códigos de cursos.
         """
-        return [registro['codigo_curso'] for registro in self._historico]
+        return list(map(_codigo_curso, self._historico))
 
     def get_cursos_aprovados(self) -> List[str]:
         """
         Retorna lista de códigos de cursos que o aluno foi aprovado.
         
+        O resultado fica em cache até a próxima alteração do histórico.
+        
         Returns:
             Lista de códigos de cursos aprovados.
         """
-        return [registro['codigo_curso'] for registro in self._historico 
-                if registro.get('situacao') == 'APROVADO']
+        cache = self._cache_aprovados
+        if cache is None or cache[0] != self._revisao:
+            aprovados = list(compress(
+                map(_codigo_curso, self._historico),
+                map(Situacao.APROVADO.__eq__, self._situacoes)
+            ))
+            cache = self._cache_aprovados = (self._revisao, aprovados)
+        return list(cache[1])
 
     def get_estatisticas(self) -> Dict[str, Any]:
         """
         Retorna estatísticas do aluno.
         
+        O resultado fica em cache até a próxima alteração do histórico ou do CR.
+        
         Returns:
             Dicionário com estatísticas.
         """
+        return dict(self._estatisticas())
+
+    def _estatisticas(self) -> Dict[str, Any]:
+        """Retorna o dicionário de estatísticas em cache (sem cópia; uso interno)."""
+        cache = self._cache_estatisticas
+        if cache is None or cache[0] != self._revisao:
+            cache = self._cache_estatisticas = (self._revisao, self._calcular_estatisticas())
+        return cache[1]
+
+    def _calcular_estatisticas(self) -> Dict[str, Any]:
+        """Calcula as estatísticas do aluno percorrendo o histórico."""
         total_cursos = len(self._historico)
-        cursos_aprovados = sum(1 for r in self._historico if r.get('situacao') == 'APROVADO')
-        cursos_reprovados = sum(1 for r in self._historico if r.get('situacao').startswith('REPROVADO'))
+        cursos_aprovados = 0
+        cursos_reprovados = 0
+        soma_notas = 0.0
+        quantidade_notas = 0
+        
+        # Constantes e método em variáveis locais (LOAD_FAST dentro do laço)
+        aprovado = int(Situacao.APROVADO)
+        mascara_reprovado = _MASCARA_REPROVADO
+        obter = dict.get
+        
+        # Uma única passada pelo histórico para todas as contagens
+        for r, situacao in zip(self._historico, self._situacoes):
+            if situacao == aprovado:
+                cursos_aprovados += 1
+            elif (1 << situacao) & mascara_reprovado:
+                cursos_reprovados += 1
+            
+            nota = obter(r, 'nota')
+            if nota is not None:
+                soma_notas += nota
+                quantidade_notas += 1
         
         # Calcular média geral de notas
-        notas = [r['nota'] for r in self._historico if 'nota' in r]
-        media_geral = round(sum(notas) / len(notas), 2) if notas else 0.0
+        media_geral = round(soma_notas / quantidade_notas, 2) if quantidade_notas else 0.0
         
         return {
             'total_cursos': total_cursos,
@@ -275,21 +561,32 @@ class Aluno(Pessoa):
             'cr': self.cr
         }
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, *, incluir_historico: bool = True,
+                incluir_estatisticas: bool = True) -> Dict[str, Any]:
         """
         Converte o aluno para um dicionário.
         
+        O histórico sai como cópia dos registros: alterar o dicionário não
+        afeta o aluno nem os índices internos do histórico.
+        
+        Args:
+            incluir_historico: Inclui a lista de registros do histórico.
+            incluir_estatisticas: Inclui as estatísticas (calculadas só quando pedidas).
+        
         Returns:
             Dict com os dados do aluno.
         """
-        return {
-            'matricula': self.matricula,
-            'nome': self.nome,
-            'email': self.email,
-            'cr': self.cr,
-            'historico': self.historico,
-            'estatisticas': self.get_estatisticas()
+        dados = {
+            'matricula': self._matricula,
+            'nome': self._nome,
+            'email': self._email,
+            'cr': self._cr
         }
+        if incluir_historico:
+            dados['historico'] = [dict(r) for r in self._historico]
+        if incluir_estatisticas:
+            dados['estatisticas'] = self.get_estatisticas()
+        return dados
 
     def to_dict_resumo(self) -> Dict[str, Any]:
         """
@@ -298,14 +595,10 @@ class Aluno(Pessoa):
         Returns:
             Dict resumido do aluno.
         """
-        return {
-            'matricula': self.matricula,
-            'nome': self.nome,
-            'email': self.email,
-            'cr': self.cr,
-            'total_cursos': len(self._historico),
-            'cursos_aprovados': len(self.get_cursos_aprovados())
-        }
+        dados = self.to_dict(incluir_historico=False, incluir_estatisticas=False)
+        dados['total_cursos'] = len(self._historico)
+        dados['cursos_aprovados'] = self._estatisticas()['cursos_aprovados']
+        return dados
 
     def __lt__(self, outro: 'Aluno') -> bool:
         """
@@ -322,15 +615,27 @@ class Aluno(Pessoa):
         if not isinstance(outro, Aluno):
             return NotImplemented
         
-        # Ordenação decrescente por CR
-        if self.cr != outro.cr:
-            return self.cr > outro.cr
-        
-        # Desempate por nome (ordem alfabética)
-        return self.nome < outro.nome
+        return self.chave_ordenacao < outro.chave_ordenacao
+
+    # Demais comparações explícitas pela mesma chave: com @total_ordering e sem
+    # um __eq__ por chave, alunos distintos com a mesma chave davam a > b e b > a
+    def __le__(self, outro: 'Aluno') -> bool:
+        if not isinstance(outro, Aluno):
+            return NotImplemented
+        return self.chave_ordenacao <= outro.chave_ordenacao
+
+    def __gt__(self, outro: 'Aluno') -> bool:
+        if not isinstance(outro, Aluno):
+            return NotImplemented
+        return self.chave_ordenacao > outro.chave_ordenacao
+
+    def __ge__(self, outro: 'Aluno') -> bool:
+        if not isinstance(outro, Aluno):
+            return NotImplemented
+        return self.chave_ordenacao >= outro.chave_ordenacao
 
     def __str__(self):
-        return f"Aluno({self.matricula}) - {self.nome} - CR: {self.cr} - Cursos: {len(self.historico)}"
+        return f"Aluno({self.matricula}) - {self.nome} - CR: {self.cr} - Cursos: {len(self._historico)}"
 
     def __repr__(self):
         return f"Aluno(matricula='{self.matricula}', nome='{self.nome}', email='{self.email}', cr={self.cr})"
\ No newline at end of file
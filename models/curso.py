@@ -1,5 +1,12 @@
 # models/curso.py
-from typing import List, Optional, Dict, Any
+import sys
+from typing import AbstractSet, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+__all__ = ['Curso', 'MemoriaCiclos', 'detectar_ciclos']
+
+
+# Sentinela para dict.pop, distinguindo "ausente" de qualquer valor armazenado
+_AUSENTE = object()
 
 
 class Curso:
@@ -8,6 +15,13 @@ class Curso:
     carga horária, ementa e pré-requisitos.
     """
 
+    __slots__ = ('_codigo', '_nome', '_carga_horaria', '_ementa', '_prerequisitos',
+                 '_prerequisitos_tupla', '_cache_dict')
+
+    # Incrementada a cada curso criado ou pré-requisito alterado; invalida as
+    # memórias (MemoriaCiclos) de verificar_ciclo_prerequisitos
+    _versao_grafo = 0
+
     def __init__(self, codigo: str, nome: str, carga_horaria: int, 
                  ementa: str = "", prerequisitos: Optional[List[str]] = None):
         """
@@ -27,14 +41,22 @@ class Curso:
             raise ValueError("Código do curso não pode ser vazio.")
         if not nome or not nome.strip():
             raise ValueError("Nome do curso não pode ser vazio.")
-        if not isinstance(carga_horaria, int) or carga_horaria <= 0:
+        # type() is: checagem exata, sem percorrer a MRO (e recusa bool)
+        if type(carga_horaria) is not int or carga_horaria <= 0:
             raise ValueError("Carga horária deve ser um inteiro maior que zero.")
         
-        self._codigo = codigo.strip()
+        # Internado: o mesmo código se repete em turmas, matrículas e pré-requisitos
+        self._codigo = sys.intern(codigo.strip())
         self._nome = nome.strip()
         self._carga_horaria = carga_horaria
         self._ementa = ementa.strip()
-        self._prerequisitos = prerequisitos if prerequisitos is not None else []
+        # dict como conjunto ordenado: pertinência O(1) mantendo a ordem de inserção
+        self._prerequisitos: Dict[str, None] = dict.fromkeys(map(sys.intern, prerequisitos or ()))
+        # Visão imutável devolvida por `prerequisitos`; refeita só após alterações
+        self._prerequisitos_tupla: Optional[Tuple[str, ...]] = None
+        # Resultado de to_dict; zerado por qualquer setter ou mudança de pré-requisitos
+        self._cache_dict: Optional[Dict[str, Any]] = None
+        Curso._versao_grafo += 1
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Curso':
@@ -71,6 +93,7 @@ class Curso:
         if not valor or not valor.strip():
             raise ValueError("Nome do curso não pode ser vazio.")
         self._nome = valor.strip()
+        self._cache_dict = None
 
     @property
     def carga_horaria(self) -> int:
@@ -80,9 +103,10 @@ class Curso:
     @carga_horaria.setter
     def carga_horaria(self, valor: int):
         """Define a carga horária do curso."""
-        if not isinstance(valor, int) or valor <= 0:
+        if type(valor) is not int or valor <= 0:
             raise ValueError("Carga horária deve ser um inteiro maior que zero.")
         self._carga_horaria = valor
+        self._cache_dict = None
 
     @property
     def ementa(self) -> str:
@@ -93,11 +117,21 @@ class Curso:
     def ementa(self, valor: str):
         """Define a ementa do curso."""
         self._ementa = valor.strip()
+        self._cache_dict = None
 
     @property
-    def prerequisitos(self) -> List[str]:
-        """Retorna uma cópia da lista de códigos dos cursos pré-requisitos."""
-        return self._prerequisitos.copy()
+    def prerequisitos(self) -> Tuple[str, ...]:
+        """Retorna os códigos dos cursos pré-requisitos (tupla imutável, sem cópia por acesso)."""
+        tupla = self._prerequisitos_tupla
+        if tupla is None:
+            tupla = self._prerequisitos_tupla = tuple(self._prerequisitos)
+        return tupla
+
+    def _prerequisitos_alterados(self) -> None:
+        """Descarta as representações derivadas da lista de pré-requisitos."""
+        self._prerequisitos_tupla = None
+        self._cache_dict = None
+        Curso._versao_grafo += 1
 
     def adicionar_prerequisito(self, codigo_curso: str) -> bool:
         """
@@ -115,7 +149,7 @@ class Curso:
         if not codigo_curso or not codigo_curso.strip():
             raise ValueError("Código do pré-requisito não pode ser vazio.")
         
-        codigo_curso = codigo_curso.strip()
+        codigo_curso = sys.intern(codigo_curso.strip())
         
         if codigo_curso == self._codigo:
             raise ValueError("Um curso não pode ser pré-requisito de si próprio.")
@@ -123,7 +157,8 @@ class Curso:
         if codigo_curso in self._prerequisitos:
             raise ValueError("Pré-requisito já foi adicionado.")
         
-        self._prerequisitos.append(codigo_curso)
+        self._prerequisitos[codigo_curso] = None
+        self._prerequisitos_alterados()
         return True
 
     def remover_prerequisito(self, codigo_curso: str) -> bool:
@@ -136,10 +171,10 @@ class Curso:
         Returns:
             bool: True se removido, False se não encontrado.
         """
-        if codigo_curso in self._prerequisitos:
-            self._prerequisitos.remove(codigo_curso)
-            return True
-        return False
+        if self._prerequisitos.pop(codigo_curso, _AUSENTE) is _AUSENTE:
+            return False
+        self._prerequisitos_alterados()
+        return True
 
     def carregar_prerequisitos(self, prerequisitos: List[str]) -> None:
         """
@@ -148,11 +183,19 @@ class Curso:
         Args:
             prerequisitos: Lista de códigos de pré-requisitos.
         """
-        self._prerequisitos = []
+        self._prerequisitos = {}
+        self._prerequisitos_alterados()
         for codigo in prerequisitos:
             self.adicionar_prerequisito(codigo)
 
-    def validar_prerequisitos(self, cursos_concluidos: List[str]) -> bool:
+    @staticmethod
+    def _como_conjunto(cursos: Iterable[str]) -> AbstractSet[str]:
+        """Converte os códigos para conjunto, reaproveitando set/frozenset já prontos."""
+        if isinstance(cursos, (set, frozenset)):
+            return cursos
+        return set(cursos)
+
+    def validar_prerequisitos(self, cursos_concluidos: Iterable[str]) -> bool:
         """
         Verifica se o aluno concluiu todos os pré-requisitos.
         
@@ -162,9 +205,12 @@ class Curso:
         Returns:
             bool: True se todos os pré-requisitos forem atendidos.
         """
-        return all(curso in cursos_concluidos for curso in self._prerequisitos)
+        # Cursos sem pré-requisitos (os introdutórios) dispensam montar o conjunto
+        if not self._prerequisitos:
+            return True
+        return self._prerequisitos.keys() <= self._como_conjunto(cursos_concluidos)
 
-    def get_prerequisitos_faltantes(self, cursos_concluidos: List[str]) -> List[str]:
+    def get_prerequisitos_faltantes(self, cursos_concluidos: Iterable[str]) -> List[str]:
         """
         Retorna lista de pré-requisitos que ainda não foram concluídos.
         
@@ -174,52 +220,62 @@ class Curso:
         Returns:
             Lista de códigos de pré-requisitos faltantes.
         """
-        return [curso for curso in self._prerequisitos if curso not in cursos_concluidos]
+        if not self._prerequisitos:
+            return []
+        concluidos = self._como_conjunto(cursos_concluidos)
+        # Percorre a lista (e não a diferença de conjuntos) para manter a ordem
+        return [curso for curso in self._prerequisitos if curso not in concluidos]
 
-    def verificar_ciclo_prerequisitos(self, todos_cursos: Dict[str, 'Curso']) -> bool:
+    def verificar_ciclo_prerequisitos(self, todos_cursos: Dict[str, 'Curso'],
+                                      memoria: Optional['MemoriaCiclos'] = None) -> bool:
         """
         Verifica se há ciclos nos pré-requisitos.
         
+        Com uma MemoriaCiclos, consultas seguidas sobre o mesmo dicionário
+        reaproveitam o trabalho já feito (cursos provados sem ciclo e cursos com
+        ciclo) enquanto nenhum curso for criado ou tiver pré-requisitos
+        alterados. A memória pertence a quem mantém o dicionário (ex.: o
+        serviço), e nada fica guardado na classe.
+        
         Args:
             todos_cursos: Dicionário com todos os cursos do sistema (código -> Curso).
+            memoria: Memória associada a `todos_cursos` (opcional).
         
         Returns:
             bool: True se há ciclo, False caso contrário.
         """
-        visitados = set()
+        if memoria is None:
+            return _buscar_ciclo(self, todos_cursos.get, set()) is not None
         
-        def dfs(curso_codigo: str) -> bool:
-            """Busca em profundidade para detectar ciclos."""
-            if curso_codigo in visitados:
-                return True  # Ciclo detectado
-            
-            visitados.add(curso_codigo)
-            curso = todos_cursos.get(curso_codigo)
-            
-            if curso:
-                for prereq in curso.prerequisitos:
-                    if dfs(prereq):
-                        return True
-            
-            visitados.remove(curso_codigo)
+        explorados, com_ciclo = memoria._conjuntos(todos_cursos)
+        if self._codigo in com_ciclo:
+            return True
+        if _buscar_ciclo(self, todos_cursos.get, explorados) is None:
             return False
-        
-        return dfs(self._codigo)
+        com_ciclo.add(self._codigo)
+        return True
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Converte o curso para um dicionário.
         
+        O dicionário é montado uma vez e reaproveitado até a próxima alteração
+        do curso; cada chamada devolve uma cópia com a própria lista de
+        pré-requisitos.
+        
         Returns:
             Dicionário com os dados do curso.
         """
-        return {
-            'codigo': self.codigo,
-            'nome': self.nome,
-            'carga_horaria': self.carga_horaria,
-            'ementa': self.ementa,
-            'prerequisitos': self.prerequisitos
-        }
+        if self._cache_dict is None:
+            self._cache_dict = {
+                'codigo': self._codigo,
+                'nome': self._nome,
+                'carga_horaria': self._carga_horaria,
+                'ementa': self._ementa,
+                'prerequisitos': self.prerequisitos
+            }
+        # Cache guarda a tupla; a lista é nova a cada chamada
+        return {**self._cache_dict, 'prerequisitos': list(self._cache_dict['prerequisitos'])}
 
     def to_dict_resumo(self) -> Dict[str, Any]:
         """
@@ -256,4 +312,104 @@ class Curso:
 
     def __repr__(self) -> str:
         """Representação técnica do curso."""
-        return f"Curso(codigo='{self.codigo}', nome='{self.nome}', carga_horaria={self.carga_horaria})"
\ No newline at end of file
+        return f"Curso(codigo='{self.codigo}', nome='{self.nome}', carga_horaria={self.carga_horaria})"
+
+
+class MemoriaCiclos:
+    """
+    Trabalho já feito por verificar_ciclo_prerequisitos sobre um dicionário de
+    cursos: códigos provados sem ciclo e códigos de onde se alcança um ciclo.
+    
+    É descartada quando o dicionário muda de identidade ou de tamanho, ou
+    quando algum curso é criado ou tem pré-requisitos alterados. Guarda só o
+    id() do dicionário, sem mantê-lo vivo; o dicionário não deve ser alterado
+    no lugar (mesmo tamanho) entre as consultas.
+    """
+
+    __slots__ = ('_chave', '_explorados', '_com_ciclo')
+
+    def __init__(self):
+        # (id do dicionário, tamanho, versão do grafo) a que os conjuntos se referem
+        self._chave: Optional[Tuple[int, int, int]] = None
+        self._explorados: Set[str] = set()
+        self._com_ciclo: Set[str] = set()
+
+    def _conjuntos(self, todos_cursos: Dict[str, Curso]) -> Tuple[Set[str], Set[str]]:
+        """Retorna (explorados, com_ciclo) válidos para o dicionário informado."""
+        chave = (id(todos_cursos), len(todos_cursos), Curso._versao_grafo)
+        if chave != self._chave:
+            self._chave = chave
+            self._explorados = set()
+            self._com_ciclo = set()
+        return self._explorados, self._com_ciclo
+
+
+def _buscar_ciclo(inicio: Curso, buscar: Callable[[str], Optional[Curso]],
+                  explorados: Set[str]) -> Optional[List[str]]:
+    """
+    DFS iterativa a partir de um curso, procurando um ciclo de pré-requisitos.
+    
+    Coloração: em_pilha (cinza) é o caminho atual, e uma aresta de volta para
+    ele fecha um ciclo; explorados (preto) são cursos cuja subárvore já foi
+    percorrida sem ciclo e nunca são revisitados. A pilha explícita evita
+    RecursionError em cadeias longas.
+    
+    Args:
+        inicio: Curso de onde a busca parte.
+        buscar: Função código -> Curso (None para códigos desconhecidos).
+        explorados: Códigos já provados sem ciclo; atualizado pela busca e
+            pode ser compartilhado entre buscas sobre o mesmo grafo.
+    
+    Returns:
+        Códigos do ciclo encontrado, na ordem do caminho, ou None.
+    """
+    if inicio._codigo in explorados:
+        return None
+    em_pilha = {inicio._codigo}
+    pilha = [(inicio._codigo, iter(inicio._prerequisitos))]
+    
+    while pilha:
+        codigo, vizinhos = pilha[-1]
+        for prereq in vizinhos:
+            if prereq in explorados:
+                continue
+            if prereq in em_pilha:
+                caminho = [codigo_pilha for codigo_pilha, _ in pilha]
+                return caminho[caminho.index(prereq):]
+            curso = buscar(prereq)
+            if curso is None:
+                explorados.add(prereq)
+                continue
+            em_pilha.add(prereq)
+            pilha.append((prereq, iter(curso._prerequisitos)))
+            break
+        else:
+            pilha.pop()
+            em_pilha.discard(codigo)
+            explorados.add(codigo)
+    
+    return None
+
+
+def detectar_ciclos(cursos: Dict[str, Curso]) -> List[str]:
+    """
+    Valida a grade inteira de uma vez, procurando um ciclo de pré-requisitos.
+    
+    Os cursos provados sem ciclo são compartilhados entre as buscas, então cada
+    curso e cada pré-requisito são percorridos uma única vez no total (em vez
+    de uma DFS completa por curso com verificar_ciclo_prerequisitos).
+    
+    Args:
+        cursos: Dicionário com todos os cursos do sistema (código -> Curso).
+    
+    Returns:
+        Códigos do primeiro ciclo encontrado, na ordem de dependência,
+        ou lista vazia se não houver ciclo.
+    """
+    buscar = cursos.get
+    explorados: Set[str] = set()
+    for curso in cursos.values():
+        ciclo = _buscar_ciclo(curso, buscar, explorados)
+        if ciclo is not None:
+            return ciclo
+    return []
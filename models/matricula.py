@@ -1,7 +1,25 @@
-from typing import Optional
-from datetime import datetime
+import sys
+from typing import Optional, Sequence
+from functools import lru_cache
+from time import localtime, strftime, time
 from config.settings import Settings
 
+__all__ = ['Matricula']
+
+
+_FORMATO_DATA = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=1)
+def _formatar_segundo(segundo: int) -> str:
+    """Formata um instante (em segundos inteiros) no padrão das datas de matrícula."""
+    return strftime(_FORMATO_DATA, localtime(segundo))
+
+
+def _agora() -> str:
+    """Data/hora local atual; chamadas no mesmo segundo reaproveitam a string."""
+    return _formatar_segundo(int(time()))
+
 
 class Matricula:
     """
@@ -10,14 +28,22 @@ class Matricula:
     além do estado de matrícula (ativa, concluída ou trancada).
     """
 
-    SITUACAO_CURSANDO = "CURSANDO"
-    SITUACAO_APROVADO = "APROVADO"
-    SITUACAO_REPROVADO_NOTA = "REPROVADO_POR_NOTA"
-    SITUACAO_REPROVADO_FREQUENCIA = "REPROVADO_POR_FREQUENCIA"
-    SITUACAO_TRANCADA = "TRANCADA"
-    SITUACAO_DESISTENTE = "DESISTENTE"
+    __slots__ = ('_id', '_aluno', '_turma', '_nota', '_frequencia', '_situacao',
+                 '_data_matricula', '_data_conclusao', '_ativa', '_cache_avaliacao',
+                 '_hash')
+
+    # Internadas: a situação vinda do banco/requisição também é internada no
+    # __init__, então as comparações com estas constantes caem na checagem
+    # de identidade antes de comparar caractere a caractere
+    SITUACAO_CURSANDO = sys.intern("CURSANDO")
+    SITUACAO_APROVADO = sys.intern("APROVADO")
+    SITUACAO_REPROVADO_NOTA = sys.intern("REPROVADO_POR_NOTA")
+    SITUACAO_REPROVADO_FREQUENCIA = sys.intern("REPROVADO_POR_FREQUENCIA")
+    SITUACAO_TRANCADA = sys.intern("TRANCADA")
+    SITUACAO_DESISTENTE = sys.intern("DESISTENTE")
     
-    _settings = Settings()
+    # Criado na primeira avaliação, não na importação do módulo (Settings lê o JSON)
+    _settings: Optional[Settings] = None
 
     def __init__(self, aluno, turma, id: Optional[int] = None, 
                  nota: Optional[float] = None, frequencia: Optional[float] = None,
@@ -43,13 +69,27 @@ class Matricula:
         self._id = id
         self._aluno = aluno
         self._turma = turma
+        # Aluno e turma não mudam após a criação: o hash é calculado uma vez
+        self._hash = hash((aluno.matricula, turma.id))
         self._nota = nota
         self._frequencia = frequencia
-        self._situacao = situacao.upper()
-        self._data_matricula = data_matricula or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._situacao = sys.intern(situacao.upper())
+        self._data_matricula = data_matricula or _agora()
         self._data_conclusao = None
-        self._ativa = self._situacao == self.SITUACAO_CURSANDO
+        # _situacao é sempre internada (aqui ou vinda das constantes SITUACAO_*),
+        # então a comparação com as constantes pode ser por identidade
+        self._ativa = self._situacao is self.SITUACAO_CURSANDO
+        # (limites usados, info_avaliacao); zerado a cada mudança de nota/situação
+        self._cache_avaliacao = None
     
+    @classmethod
+    def _get_settings(cls) -> Settings:
+        """Retorna as configurações do sistema, instanciadas no primeiro uso."""
+        settings = cls._settings
+        if settings is None:
+            settings = cls._settings = Settings()
+        return settings
+
     @classmethod
     def from_dict(cls, data: dict, aluno, turma) -> 'Matricula':
         """
@@ -145,31 +185,106 @@ class Matricula:
         Raises:
             ValueError: Se nota ou frequência estiver fora dos limites.
         """
-        self.nota = nota
-        self.frequencia = frequencia
+        # Valida os dois valores antes de alterar qualquer um e recalcula a
+        # situação uma única vez (via setters, seriam duas atualizações)
+        if not 0 <= nota <= 10:
+            raise ValueError("Nota deve estar entre 0 e 10.")
+        if not 0 <= frequencia <= 100:
+            raise ValueError("Frequência deve estar entre 0 e 100.")
+        self._nota = nota
+        self._frequencia = frequencia
+        self._atualizar_situacao()
+
+    @classmethod
+    def lancar_avaliacoes_lote(cls, matriculas: Sequence['Matricula'],
+                               notas: Sequence[float],
+                               frequencias: Sequence[float]) -> None:
+        """
+        Lança nota e frequência de várias matrículas de uma vez (ex.: uma turma inteira).
+
+        Todos os valores são validados antes de qualquer alteração, inclusive
+        o registro no histórico (curso já cursado pelo aluno ou aluno repetido
+        no mesmo curso): se algo falhar, nenhuma matrícula nem histórico é
+        alterado. Os limites de aprovação e a data de conclusão são lidos uma
+        única vez para o lote.
+
+        Args:
+            matriculas: Matrículas a avaliar.
+            notas: Notas, na mesma ordem das matrículas (0 a 10).
+            frequencias: Frequências, na mesma ordem das matrículas (0 a 100).
+
+        Raises:
+            ValueError: Se as quantidades diferirem, algum valor estiver fora dos
+                limites ou algum curso já estiver no histórico do aluno.
+        """
+        if not len(matriculas) == len(notas) == len(frequencias):
+            raise ValueError("Quantidades de matrículas, notas e frequências devem ser iguais.")
+        for nota, frequencia in zip(notas, frequencias):
+            if not 0 <= nota <= 10:
+                raise ValueError("Nota deve estar entre 0 e 10.")
+            if not 0 <= frequencia <= 100:
+                raise ValueError("Frequência deve estar entre 0 e 100.")
+        # Mesmas recusas de aluno.adicionar_ao_historico, verificadas antes do
+        # laço de alteração para que uma falha no meio não deixe o lote pela metade
+        registros = set()
+        for matricula in matriculas:
+            aluno = matricula._aluno
+            codigo_curso = matricula._turma.curso.codigo
+            chave = (id(aluno), codigo_curso)
+            if chave in registros or aluno.curso_no_historico(codigo_curso):
+                raise ValueError(
+                    f"Curso {codigo_curso} já está no histórico do aluno {aluno.matricula}."
+                )
+            registros.add(chave)
+
+        settings = cls._get_settings()
+        frequencia_minima = settings.frequencia_minima
+        nota_minima = settings.nota_minima_aprovacao
+        agora = _agora()
+        for matricula, nota, frequencia in zip(matriculas, notas, frequencias):
+            matricula._nota = nota
+            matricula._frequencia = frequencia
+            matricula._cache_avaliacao = None
+            matricula._concluir_avaliacao(frequencia_minima, nota_minima, agora)
 
     def _atualizar_situacao(self) -> None:
         """
         Define automaticamente a situação acadêmica com base na avaliação.
         Usa as configurações do sistema.
         """
+        self._cache_avaliacao = None
         if self._nota is None or self._frequencia is None:
             self._situacao = self.SITUACAO_CURSANDO
             self._ativa = True
             return
 
+        settings = self._get_settings()
+        self._concluir_avaliacao(settings.frequencia_minima,
+                                 settings.nota_minima_aprovacao, _agora())
+
+    def _concluir_avaliacao(self, frequencia_minima: float, nota_minima: float,
+                            agora: str) -> None:
+        """
+        Classifica a matrícula já avaliada (nota e frequência lançadas) e a
+        registra no histórico do aluno.
+
+        Args:
+            frequencia_minima: Frequência mínima para aprovação.
+            nota_minima: Nota mínima para aprovação.
+            agora: Data/hora de conclusão já formatada.
+        """
         # Verificar se foi reprovado por frequência
-        if self._frequencia < self._settings.frequencia_minima:
+        if self._frequencia < frequencia_minima:
             self._situacao = self.SITUACAO_REPROVADO_FREQUENCIA
         # Verificar se foi reprovado por nota
-        elif self._nota < self._settings.nota_minima_aprovacao:
+        elif self._nota < nota_minima:
             self._situacao = self.SITUACAO_REPROVADO_NOTA
         # Caso contrário, aprovado
         else:
             self._situacao = self.SITUACAO_APROVADO
         
         self._ativa = False
-        self._data_conclusao = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._data_conclusao = agora
         self._registrar_no_historico_do_aluno()
 
     def _registrar_no_historico_do_aluno(self) -> None:
@@ -199,20 +314,22 @@ class Matricula:
         if not self._ativa:
             raise ValueError("Não é possível trancar uma matrícula já finalizada.")
         
-        if not self._settings.pode_trancar():
+        if not self._get_settings().pode_trancar():
             raise ValueError("Data limite para trancamento já passou.")
         
         self._situacao = self.SITUACAO_TRANCADA
+        self._cache_avaliacao = None
         self._ativa = False
-        self._data_conclusao = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._data_conclusao = _agora()
 
     def desistir(self) -> None:
         """
         Marca a matrícula como desistente.
         """
         self._situacao = self.SITUACAO_DESISTENTE
+        self._cache_avaliacao = None
         self._ativa = False
-        self._data_conclusao = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._data_conclusao = _agora()
 
     def get_info_avaliacao(self) -> dict:
         """
@@ -221,19 +338,35 @@ class Matricula:
         Returns:
             Dict com informações da avaliação.
         """
-        return {
-            'nota': self._nota,
-            'frequencia': self._frequencia,
-            'nota_minima': self._settings.nota_minima_aprovacao,
-            'frequencia_minima': self._settings.frequencia_minima,
-            'situacao_atual': self._situacao,
-            'aprovado': self._situacao == self.SITUACAO_APROVADO
-        }
+        return dict(self._info_avaliacao())
+
+    def _info_avaliacao(self) -> dict:
+        """
+        Dicionário de avaliação em cache, reconstruído só quando a matrícula
+        muda ou quando os limites de aprovação configurados são alterados.
+        """
+        settings = self._get_settings()
+        limites = (settings.nota_minima_aprovacao, settings.frequencia_minima)
+        cache = self._cache_avaliacao
+        if cache is None or cache[0] != limites:
+            nota_minima, frequencia_minima = limites
+            cache = self._cache_avaliacao = (limites, {
+                'nota': self._nota,
+                'frequencia': self._frequencia,
+                'nota_minima': nota_minima,
+                'frequencia_minima': frequencia_minima,
+                'situacao_atual': self._situacao,
+                'aprovado': self._situacao is self.SITUACAO_APROVADO
+            })
+        return cache[1]
 
     def to_dict(self) -> dict:
         """
         Converte a matrícula para dicionário.
 
+        Os dados de aluno e turma são lidos a cada chamada; 'info_avaliacao'
+        é uma cópia do dicionário em cache, que pode ser alterada livremente.
+
         Returns:
             Dict com dados da matrícula.
         """
@@ -251,7 +384,7 @@ class Matricula:
             'ativa': self._ativa,
             'data_matricula': self._data_matricula,
             'data_conclusao': self._data_conclusao,
-            'info_avaliacao': self.get_info_avaliacao() if self._nota is not None else None
+            'info_avaliacao': dict(self._info_avaliacao()) if self._nota is not None else None
         }
 
     def to_dict_resumo(self) -> dict:
@@ -279,7 +412,7 @@ class Matricula:
 
     def __hash__(self) -> int:
         """Permite uso da matrícula em conjuntos ou como chave de dicionário."""
-        return hash((self.aluno.matricula, self.turma.id))
+        return self._hash
 
     def __str__(self) -> str:
         """Representação amigável da matrícula."""
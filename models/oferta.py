@@ -1,6 +1,53 @@
 # models/oferta.py
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Mapping, Tuple, Optional
 from datetime import time
+from itertools import islice
+from types import MappingProxyType
+
+__all__ = ['Oferta', 'verificar_choques_conjunto']
+
+
+# Dias são guardados internamente pelo código 0..6 (índice nesta tupla, que
+# também define a posição do dia na máscara semanal); nomes só na fronteira
+_DIAS_VALIDOS = ("seg", "ter", "qua", "qui", "sex", "sab", "dom")
+_INDICE_DIA = {dia: indice for indice, dia in enumerate(_DIAS_VALIDOS)}
+_MINUTOS_DIA = 24 * 60
+
+
+def _parse_minutos(intervalo: str) -> Tuple[int, int]:
+    """
+    Converte "HH:MM-HH:MM" em (início, fim) em minutos desde a meia-noite.
+
+    O formato usual é lido direto por posição, sem split nem time.fromisoformat;
+    outras grafias ISO aceitas antes (ex.: com segundos) caem no caminho geral,
+    com os segundos desprezados.
+
+    Raises:
+        ValueError: Se o intervalo não for um par de horários válido.
+    """
+    if (len(intervalo) == 11 and intervalo[2] == ":" and intervalo[5] == "-"
+            and intervalo[8] == ":"):
+        horas_inicio = intervalo[0:2]
+        minutos_inicio = intervalo[3:5]
+        horas_fim = intervalo[6:8]
+        minutos_fim = intervalo[9:11]
+        if (horas_inicio.isdigit() and minutos_inicio.isdigit()
+                and horas_fim.isdigit() and minutos_fim.isdigit()):
+            h1, m1, h2, m2 = int(horas_inicio), int(minutos_inicio), int(horas_fim), int(minutos_fim)
+            if h1 > 23 or h2 > 23 or m1 > 59 or m2 > 59:
+                raise ValueError("Horário fora do intervalo 00:00-23:59.")
+            return h1 * 60 + m1, h2 * 60 + m2
+
+    inicio_str, fim_str = intervalo.split("-")
+    inicio = time.fromisoformat(inicio_str)
+    fim = time.fromisoformat(fim_str)
+    return inicio.hour * 60 + inicio.minute, fim.hour * 60 + fim.minute
+
+
+def _mascara_intervalo(dia: int, inicio: int, fim: int) -> int:
+    """Bits dos minutos [inicio, fim) do dia na máscara semanal (1 bit por minuto)."""
+    base = dia * _MINUTOS_DIA
+    return ((1 << (fim - inicio)) - 1) << (base + inicio)
 
 
 class Oferta:
@@ -9,6 +56,9 @@ class Oferta:
     Contém atributos e métodos comuns relacionados a horários e vagas.
     """
 
+    __slots__ = ('_id', '_periodo', '_vagas', '_horarios', '_horarios_parseados', '_mascara',
+                 '_horarios_nomes', '_horarios_view')
+
     def __init__(self, id: str, periodo: str, horarios: Dict[str, str], vagas: int):
         """
         Inicializa uma oferta acadêmica.
@@ -34,7 +84,16 @@ class Oferta:
         self._id = id.strip()
         self._periodo = periodo.strip()
         self._vagas = vagas
-        self._horarios = {}
+        # Código do dia -> intervalo original
+        self._horarios: Dict[int, str] = {}
+        # Mesmos horários pelo nome do dia, como expostos em `horarios`; o dict é
+        # atualizado no lugar, então a visão somente leitura é criada uma única vez
+        self._horarios_nomes: Dict[str, str] = {}
+        self._horarios_view = MappingProxyType(self._horarios_nomes)
+        # Mesmos dias de _horarios, já convertidos para (início, fim) em minutos
+        self._horarios_parseados: Dict[int, Tuple[int, int]] = {}
+        # Semana inteira como inteiro (1 bit por minuto): choque entre ofertas é um AND
+        self._mascara = 0
         
         # Validar e normalizar horários
         for dia, intervalo in horarios.items():
@@ -70,9 +129,9 @@ class Oferta:
         self._vagas = valor
 
     @property
-    def horarios(self):
-        """Retorna uma cópia dos horários."""
-        return self._horarios.copy()
+    def horarios(self) -> Mapping[str, str]:
+        """Retorna uma visão somente leitura dos horários (use dict() para uma cópia)."""
+        return self._horarios_view
 
     def _adicionar_horario(self, dia: str, intervalo: str):
         """
@@ -86,24 +145,25 @@ class Oferta:
             ValueError: Se o dia ou intervalo forem inválidos.
         """
         # Validar dia
-        dias_validos = ["seg", "ter", "qua", "qui", "sex", "sab", "dom"]
-        dia_lower = dia.lower().strip()
-        if dia_lower not in dias_validos:
-            raise ValueError(f"Dia inválido: {dia}. Use: {', '.join(dias_validos)}")
+        codigo_dia = _INDICE_DIA.get(dia.lower().strip())
+        if codigo_dia is None:
+            raise ValueError(f"Dia inválido: {dia}. Use: {', '.join(_DIAS_VALIDOS)}")
 
         # Validar e parsear intervalo
         try:
-            inicio_str, fim_str = intervalo.split("-")
-            inicio = time.fromisoformat(inicio_str)
-            fim = time.fromisoformat(fim_str)
+            inicio, fim = _parse_minutos(intervalo)
             
             if inicio >= fim:
                 raise ValueError("Horário de início deve ser anterior ao horário de fim.")
             
-            if inicio.hour < 6 or fim.hour > 22:
+            # Mesma regra de antes por hora cheia: 22:xx ainda é aceito como fim
+            if inicio < 6 * 60 or fim // 60 > 22:
                 raise ValueError("Horários devem estar entre 06:00 e 22:00.")
             
-            self._horarios[dia_lower] = intervalo
+            self._horarios[codigo_dia] = intervalo
+            self._horarios_nomes[_DIAS_VALIDOS[codigo_dia]] = intervalo
+            self._horarios_parseados[codigo_dia] = (inicio, fim)
+            self._recalcular_mascara()
         except ValueError as e:
             raise ValueError(f"Intervalo inválido '{intervalo}': {str(e)}")
 
@@ -127,8 +187,12 @@ class Oferta:
         Returns:
             bool: True se removido, False se não encontrado.
         """
-        if dia.lower() in self._horarios:
-            del self._horarios[dia.lower()]
+        codigo_dia = _INDICE_DIA.get(dia.lower().strip())
+        if codigo_dia in self._horarios:
+            del self._horarios[codigo_dia]
+            del self._horarios_nomes[_DIAS_VALIDOS[codigo_dia]]
+            del self._horarios_parseados[codigo_dia]
+            self._recalcular_mascara()
             return True
         return False
 
@@ -143,25 +207,30 @@ class Oferta:
         Returns:
             bool: True se atualizado, False se não encontrado.
         """
-        dia_lower = dia.lower()
-        if dia_lower not in self._horarios:
+        if _INDICE_DIA.get(dia.lower().strip()) not in self._horarios:
             return False
         
         self._adicionar_horario(dia, novo_intervalo)
         return True
 
-    def _parse_intervalo(self, intervalo: str) -> Tuple[time, time]:
+    def _recalcular_mascara(self) -> None:
+        """Refaz a máscara semanal a partir dos horários parseados."""
+        mascara = 0
+        for dia, (inicio, fim) in self._horarios_parseados.items():
+            mascara |= _mascara_intervalo(dia, inicio, fim)
+        self._mascara = mascara
+
+    def _parse_intervalo(self, intervalo: str) -> Tuple[int, int]:
         """
-        Converte string de intervalo em objetos time.
+        Converte string de intervalo em minutos desde a meia-noite.
 
         Args:
             intervalo (str): Intervalo no formato "HH:MM-HH:MM".
 
         Returns:
-            Tuple[time, time]: Horário de início e fim.
+            Tuple[int, int]: Início e fim, em minutos.
         """
-        inicio_str, fim_str = intervalo.split("-")
-        return time.fromisoformat(inicio_str), time.fromisoformat(fim_str)
+        return _parse_minutos(intervalo)
 
     def verificar_choque(self, horarios_externos: Dict[str, str]) -> bool:
         """
@@ -173,10 +242,13 @@ class Oferta:
         Returns:
             bool: True se houver choque, False caso contrário.
         """
+        # Os horários próprios já estão convertidos; só os externos dos dias em
+        # comum precisam ser parseados
+        parseados = self._horarios_parseados
         for dia, intervalo_externo in horarios_externos.items():
-            if dia.lower() in self._horarios:
-                # Parsear intervalos
-                inicio_atual, fim_atual = self._parse_intervalo(self._horarios[dia.lower()])
+            atual = parseados.get(_INDICE_DIA.get(dia.lower()))
+            if atual is not None:
+                inicio_atual, fim_atual = atual
                 inicio_externo, fim_externo = self._parse_intervalo(intervalo_externo)
                 
                 # Verificar sobreposição
@@ -184,6 +256,18 @@ class Oferta:
                     return True
         return False
 
+    def verificar_choque_com_oferta(self, outra: 'Oferta') -> bool:
+        """
+        Verifica choque de horário com outra oferta usando as máscaras semanais.
+
+        Args:
+            outra (Oferta): Oferta a comparar.
+
+        Returns:
+            bool: True se algum minuto da semana for comum às duas ofertas.
+        """
+        return (self._mascara & outra._mascara) != 0
+
     def get_horarios_parseados(self) -> Dict[str, Tuple[time, time]]:
         """
         Retorna os horários parseados como objetos time.
@@ -192,8 +276,8 @@ class Oferta:
             Dict[str, Tuple[time, time]]: Horários parseados.
         """
         return {
-            dia: self._parse_intervalo(intervalo)
-            for dia, intervalo in self._horarios.items()
+            _DIAS_VALIDOS[dia]: (time(inicio // 60, inicio % 60), time(fim // 60, fim % 60))
+            for dia, (inicio, fim) in self._horarios_parseados.items()
         }
 
     def get_dias_semana(self) -> List[str]:
@@ -203,7 +287,7 @@ class Oferta:
         Returns:
             List[str]: Dias da semana.
         """
-        return list(self._horarios.keys())
+        return [_DIAS_VALIDOS[dia] for dia in self._horarios]
 
     def to_dict(self) -> Dict[str, any]:
         """
@@ -216,14 +300,49 @@ class Oferta:
             'id': self.id,
             'periodo': self.periodo,
             'vagas': self.vagas,
-            'horarios': self.horarios
+            'horarios': dict(self._horarios_nomes)
         }
 
     def __str__(self):
         """Representação amigável da oferta."""
-        dias = ", ".join([f"{dia}: {intervalo}" for dia, intervalo in self._horarios.items()])
-        return f"{self.id} - {self.periodo} - Vagas: {self.vagas} - Horários: {dias}"
+        dias = ", ".join([f"{_DIAS_VALIDOS[dia]}: {intervalo}" for dia, intervalo in self._horarios.items()])
+        return f"{self._id} - {self._periodo} - Vagas: {self._vagas} - Horários: {dias}"
 
     def __repr__(self):
         """Representação técnica da oferta."""
-        return f"Oferta(id='{self.id}', periodo='{self.periodo}', vagas={self.vagas})"
\ No newline at end of file
+        return f"Oferta(id='{self._id}', periodo='{self._periodo}', vagas={self._vagas})"
+
+
+def verificar_choques_conjunto(ofertas: Iterable[Oferta]) -> Optional[Tuple[Oferta, Oferta]]:
+    """
+    Procura um choque de horário dentro de um conjunto de ofertas (ex.: a grade
+    de um aluno no semestre), sem comparar todos os pares.
+
+    Varredura por dia: os intervalos são ordenados pelo início e basta comparar
+    cada um com o que termina mais tarde entre os anteriores, em O(n log n) por
+    dia em vez das n·(n-1)/2 chamadas a verificar_choque.
+
+    Args:
+        ofertas: Ofertas a verificar.
+
+    Returns:
+        Um par de ofertas que se chocam, ou None se não houver choque.
+    """
+    por_dia: Dict[int, List[Tuple[int, int, int, Oferta]]] = {}
+    for posicao, oferta in enumerate(ofertas):
+        for dia, (inicio, fim) in oferta._horarios_parseados.items():
+            # posicao desempata inícios iguais sem comparar as ofertas
+            por_dia.setdefault(dia, []).append((inicio, fim, posicao, oferta))
+
+    for intervalos in por_dia.values():
+        if len(intervalos) < 2:
+            continue
+        intervalos.sort()
+        _, fim_max, _, oferta_max = intervalos[0]
+        for inicio, fim, _, oferta in islice(intervalos, 1, None):
+            # Intervalos encostados (fim == início) não são choque
+            if inicio < fim_max:
+                return oferta_max, oferta
+            if fim > fim_max:
+                fim_max, oferta_max = fim, oferta
+    return None
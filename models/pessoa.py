@@ -1,6 +1,8 @@
 class Pessoa:
     """Representa uma pessoa com nome e email."""
 
+    __slots__ = ('_nome', '_email')
+
     def __init__(self, nome: str, email: str):
         if not nome or not nome.strip():
             raise ValueError("Nome não pode ser vazio.")
@@ -31,7 +33,7 @@ class Pessoa:
         self._email = valor.strip()
 
     def __str__(self):
-        return f"{self.nome} ({self.email})"
+        return f"{self._nome} ({self._email})"
 
     def __repr__(self):
-        return f"Pessoa(nome='{self.nome}', email='{self.email}')"
\ No newline at end of file
+        return f"Pessoa(nome='{self._nome}', email='{self._email}')"
\ No newline at end of file
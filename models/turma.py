@@ -1,8 +1,19 @@
 # models/turma.py
+from operator import attrgetter
+
 from models.oferta import Oferta
 from models.curso import Curso
 from typing import List, Dict, Any, Optional
 
+__all__ = ['Turma']
+
+
+# Sentinela para dict.pop, distinguindo "ausente" de qualquer valor armazenado
+_AUSENTE = object()
+
+# Projeção do aluno de uma matrícula (feita em C)
+_aluno_da_matricula = attrgetter('aluno')
+
 
 class Turma(Oferta):
     """
@@ -10,6 +21,8 @@ class Turma(Oferta):
     Possui vínculo com um curso, controla o status (aberta/fechada) e registra matrículas.
     """
 
+    __slots__ = ('_curso', '_local', '_status', '_matriculas')
+
     def __init__(self, id: str, periodo: str, horarios: Dict[str, str], 
                  vagas: int, curso: Curso, local: Optional[str] = None, status: bool=True):
         """
@@ -34,7 +47,9 @@ class Turma(Oferta):
         self._curso = curso
         self._local = local.strip() if local else None
         self._status = status
-        self._matriculas = []
+        # dict como conjunto ordenado (hash da Matricula = aluno + turma):
+        # remoção e pertinência O(1), mantendo a ordem de inserção
+        self._matriculas: Dict[Any, None] = {}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], curso: Curso) -> 'Turma':
@@ -84,7 +99,17 @@ class Turma(Oferta):
     @property
     def matriculas(self) -> List:
         """Retorna uma cópia das matrículas registradas na turma."""
-        return self._matriculas.copy()
+        return list(self._matriculas)
+
+    def get_alunos(self) -> List:
+        """
+        Retorna os alunos matriculados na turma, na ordem das matrículas.
+
+        Returns:
+            List: Alunos da turma.
+        """
+        # Percorre o conjunto interno direto, sem a cópia feita por `matriculas`
+        return list(map(_aluno_da_matricula, self._matriculas))
 
     def abrir(self):
         """Altera o status da turma para aberta."""
@@ -99,10 +124,7 @@ class Turma(Oferta):
         Atualiza status automaticamente com base nas vagas.
         Se todas as vagas estiverem ocupadas, status muda para "esgotada".
         """
-        if self.vagas_ocupadas() >= self.vagas:
-            self._status = False
-        else:
-            self._status = True
+        self._status = len(self._matriculas) < self._vagas
 
     def adicionar_matricula(self, matricula) -> bool:
         """
@@ -117,7 +139,7 @@ class Turma(Oferta):
         if not matricula:
             raise ValueError("Matrícula não pode ser nula.")
         
-        self._matriculas.append(matricula)
+        self._matriculas[matricula] = None
         self.atualizar_status_vagas()
         return True
 
@@ -131,11 +153,10 @@ class Turma(Oferta):
         Returns:
             bool: True se removida, False se não encontrada.
         """
-        if matricula in self._matriculas:
-            self._matriculas.remove(matricula)
-            self.atualizar_status_vagas()
-            return True
-        return False
+        if self._matriculas.pop(matricula, _AUSENTE) is _AUSENTE:
+            return False
+        self.atualizar_status_vagas()
+        return True
 
     def vagas_ocupadas(self) -> int:
         """
@@ -176,20 +197,28 @@ class Turma(Oferta):
         Returns:
             bool: True se houver choque de horário.
         """
-        return self.verificar_choque(outra_turma.horarios)
+        return self.verificar_choque_com_oferta(outra_turma)
 
-    def get_info_matriculas(self) -> Dict[str, Any]:
+    def get_info_matriculas(self, ocupadas: Optional[int] = None) -> Dict[str, Any]:
         """
         Retorna informações sobre as matrículas da turma.
 
+        Args:
+            ocupadas: Vagas ocupadas já calculadas pelo chamador (opcional).
+
         Returns:
             Dict com informações das matrículas.
         """
+        if ocupadas is None:
+            ocupadas = self.vagas_ocupadas()
+        vagas = self._vagas
         return {
             'total_matriculas': len(self._matriculas),
-            'vagas_ocupadas': self.vagas_ocupadas(),
-            'vagas_disponiveis': self.vagas_disponiveis(),
-            'taxa_ocupacao': round((self.vagas_ocupadas() / self.vagas) * 100, 2) if self.vagas > 0 else 0.0
+            'vagas_ocupadas': ocupadas,
+            'vagas_disponiveis': max(0, vagas - ocupadas),
+            # Centésimos de ponto percentual em aritmética inteira (arredondando
+            # ao mais próximo) e uma única divisão em ponto flutuante no final
+            'taxa_ocupacao': ((ocupadas * 20000 + vagas) // (2 * vagas)) / 100 if vagas > 0 else 0.0
         }
 
     def to_dict(self) -> Dict[str, Any]:
@@ -199,17 +228,19 @@ class Turma(Oferta):
         Returns:
             Dict com dados da turma.
         """
+        # Ocupação calculada uma vez e repassada a info_matriculas
+        ocupadas = self.vagas_ocupadas()
         return {
-            'id': self.id,
-            'periodo': self.periodo,
-            'vagas': self.vagas,
-            'horarios': self.horarios,
-            'local': self.local,
-            'status': self.status,
-            'curso': self.curso.to_dict_resumo(),
-            'vagas_ocupadas': self.vagas_ocupadas(),
-            'vagas_disponiveis': self.vagas_disponiveis(),
-            'info_matriculas': self.get_info_matriculas()
+            'id': self._id,
+            'periodo': self._periodo,
+            'vagas': self._vagas,
+            'horarios': dict(self._horarios_nomes),
+            'local': self._local,
+            'status': self._status,
+            'curso': self._curso.to_dict_resumo(),
+            'vagas_ocupadas': ocupadas,
+            'vagas_disponiveis': max(0, self._vagas - ocupadas),
+            'info_matriculas': self.get_info_matriculas(ocupadas)
         }
 
     def to_dict_resumo(self) -> Dict[str, Any]:
@@ -249,13 +280,13 @@ class Turma(Oferta):
 
     def __str__(self) -> str:
         """Representação amigável da turma."""
-        status_str = f" ({self.status})" if self.status != True else ""
-        local_str = f" - Local: {self.local}" if self.local else ""
-        return f"Turma {self.id} - {self.curso.nome} - {self.periodo}{status_str}{local_str}"
+        status_str = f" ({self._status})" if self._status != True else ""
+        local_str = f" - Local: {self._local}" if self._local else ""
+        return f"Turma {self._id} - {self._curso.nome} - {self._periodo}{status_str}{local_str}"
 
     def __repr__(self) -> str:
         """Representação técnica da turma."""
-        return f"Turma(id='{self.id}', curso='{self.curso.codigo}', periodo='{self.periodo}', status='{self.status}')"
+        return f"Turma(id='{self._id}', curso='{self._curso.codigo}', periodo='{self._periodo}', status='{self._status}')"
     
     def __bool__(self) -> bool:
         return bool(self.id) and self.id is not None
\ No newline at end of file
@@ -1,12 +1,127 @@
 # repositories/aluno_repository.py
+from contextlib import contextmanager
+from itertools import combinations
 from database.connection import SQLiteConnection
 from schemas.aluno_schema import AlunoSchema
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterable, Iterator, List, Dict, Any
+
+
+# Colunas de um registro do histórico, na ordem em que os SELECTs as trazem;
+# dict(zip(...)) monta o registro em C, sem uma atribuição por campo
+_COLUNAS_HISTORICO = (
+    'id', 'codigo_curso', 'nota', 'frequencia', 'carga_horaria',
+    'situacao', 'semestre', 'data_registro'
+)
+
+# Aluno e histórico em uma única consulta; as linhas de um mesmo aluno vêm
+# juntas (ORDER BY a.rowid) e o histórico na mesma ordem de buscar_historico_aluno
+_SELECT_ALUNOS_COM_HISTORICO = """
+            SELECT 
+                a.matricula, a.nome, a.email, a.cr,
+                h.id, h.codigo_curso, h.nota, h.frequencia, h.carga_horaria,
+                h.situacao, h.semestre, h.data_registro
+            FROM aluno a
+            LEFT JOIN historico_aluno h ON h.aluno_matricula = a.matricula"""
+
+# Matrículas por consulta com IN (abaixo do limite de 999 parâmetros das
+# versões antigas do SQLite)
+_TAMANHO_LOTE_IN = 500
+
+
+def _agrupar_alunos(linhas: Iterable) -> Iterator[AlunoSchema]:
+    """
+    Monta um AlunoSchema por aluno a partir das linhas de _SELECT_ALUNOS_COM_HISTORICO,
+    já ordenadas de modo que as linhas de cada aluno venham juntas.
+    """
+    matricula_atual = None
+    for row in linhas:
+        matricula = row['matricula']
+        if matricula != matricula_atual:
+            if matricula_atual is not None:
+                yield AlunoSchema(**dados_aluno, historico=historico)
+            matricula_atual = matricula
+            dados_aluno = {
+                'matricula': matricula,
+                'nome': row['nome'],
+                'email': row['email'],
+                'cr': row['cr']
+            }
+            historico = []
+        
+        # Aluno sem histórico: LEFT JOIN traz as colunas de h como NULL
+        if row['id'] is not None:
+            historico.append(dict(zip(_COLUNAS_HISTORICO, row[4:])))
+    
+    if matricula_atual is not None:
+        yield AlunoSchema(**dados_aluno, historico=historico)
+
+
+# Somas do CR com os mesmos filtros de Aluno (situações que contam e carga > 0)
+_SQL_SOMAS_CR = """
+            SELECT 
+                SUM(nota * carga_horaria) as soma_ponderada,
+                SUM(carga_horaria) as total_carga
+            FROM historico_aluno 
+            WHERE aluno_matricula = ? 
+            AND situacao IN ('APROVADO', 'REPROVADO_POR_NOTA')
+            AND carga_horaria > 0
+        """
+
+
+def _cr_das_somas(row) -> float:
+    """
+    CR a partir da linha de _SQL_SOMAS_CR, arredondado com round() como em
+    Aluno.calcular_cr (o ROUND do SQLite desempata de outro jeito).
+    """
+    if row and row['total_carga'] and row['total_carga'] > 0:
+        return round(row['soma_ponderada'] / row['total_carga'], 2)
+    return 0.0
+
+
+# Campos que podem ser atualizados, na ordem canônica usada nos UPDATEs
+_CAMPOS_ATUALIZAVEIS_ALUNO = ('nome', 'email', 'cr')
+_CAMPOS_ATUALIZAVEIS_HISTORICO = ('nota', 'frequencia', 'situacao', 'semestre')
+
+
+def _gerar_updates(campos: tuple, modelo: str) -> Dict[tuple, str]:
+    """
+    Gera o UPDATE de cada combinação não vazia de campos, na ordem canônica.
+
+    Cada combinação tem sempre o mesmo texto SQL (independente da ordem das
+    chaves recebidas), que vira acerto no cache de statements da conexão.
+    """
+    return {
+        combinacao: modelo.format(", ".join(f"{campo} = ?" for campo in combinacao))
+        for quantidade in range(1, len(campos) + 1)
+        for combinacao in combinations(campos, quantidade)
+    }
+
+
+_UPDATES_ALUNO = _gerar_updates(_CAMPOS_ATUALIZAVEIS_ALUNO, """
+            UPDATE aluno
+            SET {}
+            WHERE matricula = ?;
+        """)
+_UPDATES_HISTORICO = _gerar_updates(_CAMPOS_ATUALIZAVEIS_HISTORICO, """
+            UPDATE historico_aluno
+            SET {}, data_registro = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """)
 
 
 class AlunoRepository:
-    def __init__(self):
-        self.conn, self.cursor = SQLiteConnection.get_connection()
+    @contextmanager
+    def transacao(self):
+        """
+        Agrupa várias escritas do repositório em uma única transação.
+        
+        As escritas feitas dentro do bloco são confirmadas juntas na saída,
+        ou todas desfeitas se uma exceção escapar do bloco.
+        """
+        # Os métodos de escrita não chamam commit()/rollback(): o acquire_write
+        # mais externo confirma ou desfaz, e os aninhados reutilizam a transação
+        with SQLiteConnection.acquire_write():
+            yield
     
     def salvar(self, aluno: AlunoSchema) -> bool:
         """
@@ -23,25 +138,26 @@ class AlunoRepository:
             VALUES (?, ?, ?, ?)
         """
         
-        try:
-            self.cursor.execute(sql, (
-                aluno.matricula, 
-                aluno.nome, 
-                aluno.email, 
-                aluno.cr or 0.0
-            ))
-            self.conn.commit()
-            return True
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao salvar aluno: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (
+                    aluno.matricula, 
+                    aluno.nome, 
+                    aluno.email, 
+                    aluno.cr or 0.0
+                ))
+                return True
+            except Exception as e:
+                raise ValueError(f"Erro ao salvar aluno: {str(e)}")
     
-    def buscar_por_matricula(self, matricula: str) -> Optional[AlunoSchema]:
+    def buscar_por_matricula(self, matricula: str, incluir_historico: bool = True) -> Optional[AlunoSchema]:
         """
         Busca um aluno pela matrícula.
         
         Args:
             matricula: Matrícula do aluno.
+            incluir_historico: Se False, não consulta o histórico (retorna-o vazio);
+                para quem só precisa dos dados cadastrais e do CR gravado.
             
         Returns:
             AlunoSchema se encontrado, None caso contrário.
@@ -51,14 +167,15 @@ class AlunoRepository:
             WHERE matricula = ?;
         """
         
-        self.cursor.execute(sql, (matricula,))
-        row = self.cursor.fetchone()
-        
-        if row is None:
-            return None
-        
-        # Buscar histórico do aluno
-        historico = self.buscar_historico_aluno(matricula)
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (matricula,))
+            row = cursor.fetchone()
+            
+            if row is None:
+                return None
+            
+            # Buscar histórico do aluno
+            historico = self.buscar_historico_aluno(matricula) if incluir_historico else []
         
         return AlunoSchema(
             matricula=row['matricula'],
@@ -75,25 +192,88 @@ class AlunoRepository:
         Returns:
             Lista de AlunoSchema.
         """
-        sql = """
-            SELECT matricula, nome, email, cr FROM aluno;
+        return list(self.iter_alunos())
+    
+    def iter_alunos(self, incluir_historico: bool = True) -> Iterator[AlunoSchema]:
         """
+        Percorre todos os alunos, um de cada vez.
+        
+        Os alunos são lidos em lotes (por rowid) e cada lote é carregado por
+        inteiro antes de ser entregue: a conexão de leitura volta ao pool a
+        cada lote, e não fica presa enquanto o gerador está suspenso. Sem
+        materializar a tabela inteira em memória; cada lote é uma leitura
+        própria, então alterações feitas durante a iteração podem aparecer
+        nos lotes seguintes.
         
-        self.cursor.execute(sql)
-        rows = self.cursor.fetchall()
+        Args:
+            incluir_historico: Se False, lê só a tabela aluno (histórico vazio);
+                para listagens que usam apenas os dados cadastrais e o CR gravado.
+        
+        Yields:
+            AlunoSchema de cada aluno, na ordem de cadastro.
+        """
+        sql_alunos = """
+            SELECT rowid, matricula, nome, email, cr FROM aluno
+            WHERE rowid > ? ORDER BY rowid LIMIT ?
+        """
+        # Alunos e históricos do lote em uma única consulta (em vez de uma por aluno)
+        sql_historico = f"""
+            {_SELECT_ALUNOS_COM_HISTORICO}
+            WHERE a.rowid > ? AND a.rowid <= ?
+            ORDER BY a.rowid, h.data_registro DESC, h.semestre DESC
+        """
+        ultimo_rowid = 0
+        
+        while True:
+            with SQLiteConnection.acquire_read() as (conn, cursor):
+                cursor.execute(sql_alunos, (ultimo_rowid, _TAMANHO_LOTE_IN))
+                linhas = cursor.fetchall()
+                if not linhas:
+                    return
+                
+                if incluir_historico:
+                    cursor.execute(sql_historico, (ultimo_rowid, linhas[-1]['rowid']))
+                    lote = list(_agrupar_alunos(cursor))
+                else:
+                    lote = [
+                        AlunoSchema(
+                            matricula=row['matricula'],
+                            nome=row['nome'],
+                            email=row['email'],
+                            cr=row['cr']
+                        )
+                        for row in linhas
+                    ]
+            
+            ultimo_rowid = linhas[-1]['rowid']
+            yield from lote
+    
+    def buscar_muitos_por_matricula(self, matriculas: Iterable[str]) -> Dict[str, AlunoSchema]:
+        """
+        Busca vários alunos, com histórico, em poucas consultas.
         
-        alunos = []
-        for row in rows:
-            # Buscar histórico para cada aluno
-            historico = self.buscar_historico_aluno(row['matricula'])
+        Args:
+            matriculas: Matrículas dos alunos.
             
-            alunos.append(AlunoSchema(
-                matricula=row['matricula'],
-                nome=row['nome'],
-                email=row['email'],
-                cr=row['cr'],
-                historico=historico
-            ))
+        Returns:
+            Dicionário matrícula -> AlunoSchema, apenas com os alunos encontrados.
+        """
+        # Sem duplicatas, em lotes que respeitam o limite de parâmetros do SQLite
+        matriculas = list(dict.fromkeys(matriculas))
+        alunos = {}
+        
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            for inicio in range(0, len(matriculas), _TAMANHO_LOTE_IN):
+                lote = matriculas[inicio:inicio + _TAMANHO_LOTE_IN]
+                placeholders = ','.join('?' * len(lote))
+                sql = f"""
+                    {_SELECT_ALUNOS_COM_HISTORICO}
+                    WHERE a.matricula IN ({placeholders})
+                    ORDER BY a.rowid, h.data_registro DESC, h.semestre DESC
+                """
+                cursor.execute(sql, lote)
+                for aluno in _agrupar_alunos(cursor):
+                    alunos[aluno.matricula] = aluno
         
         return alunos
     
@@ -111,18 +291,14 @@ class AlunoRepository:
             DELETE FROM aluno WHERE matricula = ?;
         """
         
-        try:
-            self.cursor.execute(sql, (matricula,))
-            self.conn.commit()
-            
-            # Verificar se alguma linha foi afetada
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao deletar aluno: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (matricula,))
+                # rowcount já traz as linhas afetadas, sem outro SELECT changes()
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao deletar aluno: {str(e)}")
     
     def atualizar(self, matricula: str, dados: dict) -> bool:
         """
@@ -138,35 +314,21 @@ class AlunoRepository:
         if not dados:
             return False
         
-        campos = []
-        valores = []
-        
-        for campo, valor in dados.items():
-            if campo in ['nome', 'email', 'cr']:
-                campos.append(f"{campo} = ?")
-                valores.append(valor)
-        
+        campos = tuple(campo for campo in _CAMPOS_ATUALIZAVEIS_ALUNO if campo in dados)
         if not campos:
             return False
         
-        sql = f"""
-            UPDATE aluno
-            SET {", ".join(campos)}
-            WHERE matricula = ?;
-        """
+        sql = _UPDATES_ALUNO[campos]
+        valores = [dados[campo] for campo in campos]
         valores.append(matricula)
         
-        try:
-            self.cursor.execute(sql, tuple(valores))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar aluno: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, valores)
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar aluno: {str(e)}")
     
     def existe_matricula(self, matricula: str) -> bool:
         """
@@ -178,12 +340,13 @@ class AlunoRepository:
         Returns:
             True se existe, False caso contrário.
         """
+        # EXISTS sempre devolve uma linha com 0/1 e para no primeiro registro
         sql = """
-            SELECT 1 FROM aluno WHERE matricula = ? LIMIT 1;
+            SELECT EXISTS(SELECT 1 FROM aluno WHERE matricula = ?);
         """
         
-        self.cursor.execute(sql, (matricula,))
-        return self.cursor.fetchone() is not None
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            return cursor.execute(sql, (matricula,)).fetchone()[0] == 1
     
     # ========== MÉTODOS PARA HISTÓRICO ==========
     
@@ -204,8 +367,42 @@ class AlunoRepository:
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """
         
-        try:
-            self.cursor.execute(sql, (
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (
+                    aluno_matricula,
+                    registro['codigo_curso'],
+                    registro['nota'],
+                    registro['frequencia'],
+                    registro['carga_horaria'],
+                    registro['situacao'],
+                    registro.get('semestre')
+                ))
+                return cursor.lastrowid
+            except Exception as e:
+                raise ValueError(f"Erro ao adicionar histórico: {str(e)}")
+    
+    def adicionar_historico_lote(self, aluno_matricula: str, registros: Iterable[Dict[str, Any]]) -> int:
+        """
+        Adiciona vários registros ao histórico do aluno em uma única transação.
+        
+        Args:
+            aluno_matricula: Matrícula do aluno.
+            registros: Registros (dicionários) a inserir; pode ser um gerador.
+            
+        Returns:
+            Quantidade de registros inseridos.
+        """
+        sql = """
+            INSERT INTO historico_aluno 
+            (aluno_matricula, codigo_curso, nota, frequencia, carga_horaria, situacao, semestre)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """
+        
+        # Gerador consumido pelo executemany: as tuplas não são materializadas
+        # em lista, e cada linha liga só 7 parâmetros (sem limite de variáveis)
+        params = (
+            (
                 aluno_matricula,
                 registro['codigo_curso'],
                 registro['nota'],
@@ -213,12 +410,17 @@ class AlunoRepository:
                 registro['carga_horaria'],
                 registro['situacao'],
                 registro.get('semestre')
-            ))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao adicionar histórico: {str(e)}")
+            )
+            for registro in registros
+        )
+        
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.executemany(sql, params)
+                inseridos = cursor.rowcount
+                return inseridos
+            except Exception as e:
+                raise ValueError(f"Erro ao adicionar histórico: {str(e)}")
     
     def buscar_historico_aluno(self, aluno_matricula: str) -> List[Dict[str, Any]]:
         """
@@ -239,23 +441,11 @@ class AlunoRepository:
             ORDER BY data_registro DESC, semestre DESC
         """
         
-        self.cursor.execute(sql, (aluno_matricula,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (aluno_matricula,))
+            rows = cursor.fetchall()
         
-        historico = []
-        for row in rows:
-            historico.append({
-                'id': row['id'],
-                'codigo_curso': row['codigo_curso'],
-                'nota': row['nota'],
-                'frequencia': row['frequencia'],
-                'carga_horaria': row['carga_horaria'],
-                'situacao': row['situacao'],
-                'semestre': row['semestre'],
-                'data_registro': row['data_registro']
-            })
-        
-        return historico
+        return [dict(zip(_COLUNAS_HISTORICO, row)) for row in rows]
     
     def buscar_registro_historico(self, registro_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -271,8 +461,9 @@ class AlunoRepository:
             SELECT * FROM historico_aluno WHERE id = ?
         """
         
-        self.cursor.execute(sql, (registro_id,))
-        row = self.cursor.fetchone()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (registro_id,))
+            row = cursor.fetchone()
         
         if row is None:
             return None
@@ -293,37 +484,21 @@ class AlunoRepository:
         if not dados:
             return False
         
-        campos = []
-        valores = []
-        
-        campos_validos = ['nota', 'frequencia', 'situacao', 'semestre']
-        
-        for campo, valor in dados.items():
-            if campo in campos_validos:
-                campos.append(f"{campo} = ?")
-                valores.append(valor)
-        
+        campos = tuple(campo for campo in _CAMPOS_ATUALIZAVEIS_HISTORICO if campo in dados)
         if not campos:
             return False
         
-        sql = f"""
-            UPDATE historico_aluno
-            SET {", ".join(campos)}, data_registro = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """
+        sql = _UPDATES_HISTORICO[campos]
+        valores = [dados[campo] for campo in campos]
         valores.append(registro_id)
         
-        try:
-            self.cursor.execute(sql, tuple(valores))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar histórico: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, valores)
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar histórico: {str(e)}")
     
     def remover_historico(self, registro_id: int) -> bool:
         """
@@ -339,17 +514,13 @@ class AlunoRepository:
             DELETE FROM historico_aluno WHERE id = ?
         """
         
-        try:
-            self.cursor.execute(sql, (registro_id,))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao remover histórico: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (registro_id,))
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao remover histórico: {str(e)}")
     
     def remover_historico_por_curso(self, aluno_matricula: str, codigo_curso: str) -> bool:
         """
@@ -367,17 +538,13 @@ class AlunoRepository:
             WHERE aluno_matricula = ? AND codigo_curso = ?
         """
         
-        try:
-            self.cursor.execute(sql, (aluno_matricula, codigo_curso))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao remover curso do histórico: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (aluno_matricula, codigo_curso))
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao remover curso do histórico: {str(e)}")
     
     def verificar_curso_aprovado(self, aluno_matricula: str, codigo_curso: str) -> bool:
         """
@@ -391,15 +558,16 @@ class AlunoRepository:
             True se aprovado, False caso contrário.
         """
         sql = """
-            SELECT 1 FROM historico_aluno 
-            WHERE aluno_matricula = ? 
-            AND codigo_curso = ? 
-            AND situacao = 'APROVADO'
-            LIMIT 1
+            SELECT EXISTS(
+                SELECT 1 FROM historico_aluno 
+                WHERE aluno_matricula = ? 
+                AND codigo_curso = ? 
+                AND situacao = 'APROVADO'
+            )
         """
         
-        self.cursor.execute(sql, (aluno_matricula, codigo_curso))
-        return self.cursor.fetchone() is not None
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            return cursor.execute(sql, (aluno_matricula, codigo_curso)).fetchone()[0] == 1
     
     def get_cursos_aprovados(self, aluno_matricula: str) -> List[str]:
         """
@@ -416,8 +584,9 @@ class AlunoRepository:
             WHERE aluno_matricula = ? AND situacao = 'APROVADO'
         """
         
-        self.cursor.execute(sql, (aluno_matricula,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (aluno_matricula,))
+            rows = cursor.fetchall()
         
         return [row['codigo_curso'] for row in rows]
     
@@ -431,23 +600,9 @@ class AlunoRepository:
         Returns:
             Valor do CR.
         """
-        sql = """
-            SELECT 
-                SUM(nota * carga_horaria) as soma_ponderada,
-                SUM(carga_horaria) as total_carga
-            FROM historico_aluno 
-            WHERE aluno_matricula = ? 
-            AND situacao IN ('APROVADO', 'REPROVADO_POR_NOTA')
-        """
-        
-        self.cursor.execute(sql, (aluno_matricula,))
-        row = self.cursor.fetchone()
-        
-        if row and row['total_carga'] and row['total_carga'] > 0:
-            cr = row['soma_ponderada'] / row['total_carga']
-            return round(cr, 2)
-        
-        return 0.0
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(_SQL_SOMAS_CR, (aluno_matricula,))
+            return _cr_das_somas(cursor.fetchone())
     
     def atualizar_cr_aluno(self, aluno_matricula: str) -> bool:
         """
@@ -459,20 +614,18 @@ class AlunoRepository:
         Returns:
             True se atualizado, False caso contrário.
         """
-        cr = self.calcular_cr_aluno(aluno_matricula)
-        
         sql = """
             UPDATE aluno SET cr = ? WHERE matricula = ?
         """
         
-        try:
-            self.cursor.execute(sql, (cr, aluno_matricula))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar CR do aluno: {str(e)}")
\ No newline at end of file
+        # Somas lidas pela própria conexão de escrita, no mesmo bloco do UPDATE:
+        # enxergam o histórico ainda não confirmado de uma transacao() externa e
+        # não há intervalo entre ler e gravar o CR
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(_SQL_SOMAS_CR, (aluno_matricula,))
+                cr = _cr_das_somas(cursor.fetchone())
+                cursor.execute(sql, (cr, aluno_matricula))
+                return cursor.rowcount > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar CR do aluno: {str(e)}")
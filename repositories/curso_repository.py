@@ -6,9 +6,6 @@ from typing import Optional, List, Dict, Any
 
 
 class CursoRepository:
-    def __init__(self):
-        self.conn, self.cursor = SQLiteConnection.get_connection()
-    
     def create(self, curso: CursoSchema) -> bool:
         """
         Cria um novo curso no banco de dados.
@@ -27,18 +24,17 @@ class CursoRepository:
             VALUES (?, ?, ?, ?)
         """
         
-        try:
-            self.cursor.execute(sql, (
-                curso.codigo, 
-                curso.nome, 
-                curso.carga_horaria, 
-                curso.ementa if hasattr(curso, 'ementa') and curso.ementa else ""
-            ))
-            self.conn.commit()
-            return True
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao criar curso: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (
+                    curso.codigo, 
+                    curso.nome, 
+                    curso.carga_horaria, 
+                    curso.ementa if hasattr(curso, 'ementa') and curso.ementa else ""
+                ))
+                return True
+            except Exception as e:
+                raise ValueError(f"Erro ao criar curso: {str(e)}")
     
     def get_by_codigo(self, codigo_curso: str) -> Optional[CursoSchema]:
         """
@@ -56,8 +52,9 @@ class CursoRepository:
             WHERE codigo = ?;
         """
         
-        self.cursor.execute(sql, (codigo_curso,))
-        row = self.cursor.fetchone()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (codigo_curso,))
+            row = cursor.fetchone()
         
         if row is None:
             return None
@@ -81,8 +78,9 @@ class CursoRepository:
             ORDER BY nome;
         """
         
-        self.cursor.execute(sql)
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql)
+            rows = cursor.fetchall()
         
         return [
             CursoSchema(
@@ -107,26 +105,21 @@ class CursoRepository:
             DELETE FROM curso WHERE codigo = ?;
         """
         
-        try:
-            # Primeiro, deletar pré-requisitos associados
-            sql_delete_prereqs = """
-                DELETE FROM curso_prerequisito 
-                WHERE curso_codigo = ? OR prerequisito_codigo = ?
-            """
-            self.cursor.execute(sql_delete_prereqs, (codigo_curso, codigo_curso))
-            
-            # Agora deletar o curso
-            self.cursor.execute(sql, (codigo_curso,))
-            self.conn.commit()
-            
-            # Verificar se alguma linha foi afetada
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao deletar curso: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                # Primeiro, deletar pré-requisitos associados
+                sql_delete_prereqs = """
+                    DELETE FROM curso_prerequisito 
+                    WHERE curso_codigo = ? OR prerequisito_codigo = ?
+                """
+                cursor.execute(sql_delete_prereqs, (codigo_curso, codigo_curso))
+                
+                # Agora deletar o curso
+                cursor.execute(sql, (codigo_curso,))
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao deletar curso: {str(e)}")
     
     def update(self, codigo: str, dados: dict) -> bool:
         """
@@ -160,17 +153,13 @@ class CursoRepository:
         """
         valores.append(codigo)
         
-        try:
-            self.cursor.execute(sql, tuple(valores))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar curso: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, tuple(valores))
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar curso: {str(e)}")
     
     def create_prerequisitos(self, codigo_curso: str, prerequisito_curso: str) -> bool:
         """
@@ -191,13 +180,12 @@ class CursoRepository:
             VALUES (?, ?)
         """
         
-        try:
-            self.cursor.execute(sql, (codigo_curso, prerequisito_curso))
-            self.conn.commit()
-            return True
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao adicionar pré-requisito: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (codigo_curso, prerequisito_curso))
+                return True
+            except Exception as e:
+                raise ValueError(f"Erro ao adicionar pré-requisito: {str(e)}")
     
     def get_prerequisitos(self, codigo_curso: str) -> List[str]:
         """
@@ -216,8 +204,9 @@ class CursoRepository:
             ORDER BY prerequisito_codigo
         """
         
-        self.cursor.execute(sql, (codigo_curso,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (codigo_curso,))
+            rows = cursor.fetchall()
         
         return [row['prerequisito_codigo'] for row in rows]
     
@@ -237,17 +226,13 @@ class CursoRepository:
             WHERE curso_codigo = ? AND prerequisito_codigo = ?
         """
         
-        try:
-            self.cursor.execute(sql, (codigo_curso, prerequisito_curso))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao remover pré-requisito: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (codigo_curso, prerequisito_curso))
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao remover pré-requisito: {str(e)}")
     
     def get_cursos_que_tem_como_prerequisito(self, prerequisito_codigo: str) -> List[str]:
         """
@@ -265,8 +250,9 @@ class CursoRepository:
             WHERE prerequisito_codigo = ?
         """
         
-        self.cursor.execute(sql, (prerequisito_codigo,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (prerequisito_codigo,))
+            rows = cursor.fetchall()
         
         return [row['curso_codigo'] for row in rows]
     
@@ -322,8 +308,9 @@ class CursoRepository:
             ORDER BY nome
         """
         
-        self.cursor.execute(sql, (f"%{nome.lower()}%",))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (f"%{nome.lower()}%",))
+            rows = cursor.fetchall()
         
         return [
             CursoSchema(
@@ -4,9 +4,6 @@ from datetime import datetime
 
 
 class MatriculaRepository:
-    def __init__(self):
-        self.conn, self.cursor = SQLiteConnection.get_connection()
-    
     def get_all(self) -> List[Dict[str, Any]]:
         """
         Retorna todas as matrículas.
@@ -34,8 +31,9 @@ class MatriculaRepository:
             ORDER BY m.data_matricula DESC
         """
         
-        self.cursor.execute(sql)
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql)
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     
@@ -69,8 +67,9 @@ class MatriculaRepository:
             WHERE m.id = ?
         """
         
-        self.cursor.execute(sql, (id,))
-        row = self.cursor.fetchone()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (id,))
+            row = cursor.fetchone()
         
         if not row:
             return None
@@ -95,18 +94,17 @@ class MatriculaRepository:
             VALUES (?, ?, ?, ?)
         """
         
-        try:
-            self.cursor.execute(sql, (
-                dados["aluno_matricula"],
-                dados["turma_id"],
-                dados.get("situacao", "CURSANDO"),
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            ))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao criar matrícula: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (
+                    dados["aluno_matricula"],
+                    dados["turma_id"],
+                    dados.get("situacao", "CURSANDO"),
+                    datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                ))
+                return cursor.lastrowid
+            except Exception as e:
+                raise ValueError(f"Erro ao criar matrícula: {str(e)}")
     
     def delete(self, id: int) -> bool:
         """
@@ -120,17 +118,13 @@ class MatriculaRepository:
         """
         sql = "DELETE FROM matricula WHERE id = ?"
         
-        try:
-            self.cursor.execute(sql, (id,))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao deletar matrícula: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, (id,))
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao deletar matrícula: {str(e)}")
     
     def update(self, id: int, dados: Dict[str, Any]) -> bool:
         """
@@ -166,17 +160,13 @@ class MatriculaRepository:
         """
         valores.append(id)
         
-        try:
-            self.cursor.execute(sql, tuple(valores))
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar matrícula: {str(e)}")
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql, tuple(valores))
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar matrícula: {str(e)}")
     
     def buscar_por_aluno_e_turma(self, aluno_matricula: str, turma_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -195,8 +185,9 @@ class MatriculaRepository:
             LIMIT 1
         """
         
-        self.cursor.execute(sql, (aluno_matricula, turma_id))
-        row = self.cursor.fetchone()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (aluno_matricula, turma_id))
+            row = cursor.fetchone()
         
         return dict(row) if row else None
     
@@ -228,8 +219,9 @@ class MatriculaRepository:
             WHERE turma_id = ? AND situacao IN ('CURSANDO', 'APROVADO', 'REPROVADO_POR_NOTA', 'REPROVADO_POR_FREQUENCIA')
         """
         
-        self.cursor.execute(sql, (turma_id,))
-        return self.cursor.fetchone()[0]
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (turma_id,))
+            return cursor.fetchone()[0]
     
     def count_matriculas_por_aluno(self, aluno_matricula: str, periodo: Optional[str] = None) -> int:
         """
@@ -250,16 +242,18 @@ class MatriculaRepository:
                 AND t.periodo = ?
                 AND m.situacao IN ('CURSANDO', 'APROVADO', 'REPROVADO_POR_NOTA', 'REPROVADO_POR_FREQUENCIA')
             """
-            self.cursor.execute(sql, (aluno_matricula, periodo))
+            params = (aluno_matricula, periodo)
         else:
             sql = """
                 SELECT COUNT(*) FROM matricula 
                 WHERE aluno_matricula = ? 
                 AND situacao IN ('CURSANDO', 'APROVADO', 'REPROVADO_POR_NOTA', 'REPROVADO_POR_FREQUENCIA')
             """
-            self.cursor.execute(sql, (aluno_matricula,))
+            params = (aluno_matricula,)
         
-        return self.cursor.fetchone()[0]
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, params)
+            return cursor.fetchone()[0]
     
     def listar_matriculas_por_aluno(self, aluno_matricula: str) -> List[Dict[str, Any]]:
         """
@@ -289,8 +283,9 @@ class MatriculaRepository:
             ORDER BY t.periodo DESC, m.data_matricula DESC
         """
         
-        self.cursor.execute(sql, (aluno_matricula,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (aluno_matricula,))
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     
@@ -319,8 +314,9 @@ class MatriculaRepository:
             ORDER BY a.nome
         """
         
-        self.cursor.execute(sql, (turma_id,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (turma_id,))
+            rows = cursor.fetchall()
         
         return [dict(row) for row in rows]
     
@@ -340,8 +336,9 @@ class MatriculaRepository:
             AND situacao IN ('CURSANDO', 'APROVADO', 'REPROVADO_POR_NOTA', 'REPROVADO_POR_FREQUENCIA')
         """
         
-        self.cursor.execute(sql, (aluno_matricula,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (aluno_matricula,))
+            rows = cursor.fetchall()
         
         return [row['turma_id'] for row in rows]
     
@@ -366,8 +363,9 @@ class MatriculaRepository:
             AND m.situacao IN ('CURSANDO', 'APROVADO', 'REPROVADO_POR_NOTA', 'REPROVADO_POR_FREQUENCIA')
         """
         
-        self.cursor.execute(sql, (aluno_matricula, periodo))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (aluno_matricula, periodo))
+            rows = cursor.fetchall()
         
         horarios = {}
         for row in rows:
@@ -398,32 +396,28 @@ class MatriculaRepository:
             WHERE id = ?
         """
         
-        try:
-            self.cursor.execute(update_sql, (nota, frequencia, matricula_id))
-            
-            # Atualizar situação baseada nas regras
-            from config.settings import Settings
-            settings = Settings()
-            
-            if frequencia < settings.frequencia_minima:
-                situacao = 'REPROVADO_POR_FREQUENCIA'
-            elif nota < settings.nota_minima_aprovacao:
-                situacao = 'REPROVADO_POR_NOTA'
-            else:
-                situacao = 'APROVADO'
-            
-            # Atualizar situação
-            self.cursor.execute(
-                "UPDATE matricula SET situacao = ? WHERE id = ?",
-                (situacao, matricula_id)
-            )
-            
-            self.conn.commit()
-            
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar nota/frequência: {str(e)}")
\ No newline at end of file
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(update_sql, (nota, frequencia, matricula_id))
+                
+                # Atualizar situação baseada nas regras
+                from config.settings import Settings
+                settings = Settings()
+                
+                if frequencia < settings.frequencia_minima:
+                    situacao = 'REPROVADO_POR_FREQUENCIA'
+                elif nota < settings.nota_minima_aprovacao:
+                    situacao = 'REPROVADO_POR_NOTA'
+                else:
+                    situacao = 'APROVADO'
+                
+                # Atualizar situação
+                cursor.execute(
+                    "UPDATE matricula SET situacao = ? WHERE id = ?",
+                    (situacao, matricula_id)
+                )
+                
+                alterados = cursor.rowcount
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar nota/frequência: {str(e)}")
\ No newline at end of file
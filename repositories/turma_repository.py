@@ -5,9 +5,6 @@ from typing import Optional, List, Dict, Any
 
 
 class TurmaRepository:
-    def __init__(self):
-        self.conn, self.cursor = SQLiteConnection.get_connection()
-    
     def create(self, turma: Turma) -> bool:
         """
         Cria uma nova turma no banco de dados.
@@ -26,33 +23,32 @@ class TurmaRepository:
             VALUES (?, ?, ?, ?, ?, ?)
         """
         
-        try:
-            self.cursor.execute(sql_turma, (
-                turma.id, 
-                turma.periodo, 
-                turma.vagas, 
-                turma.curso.codigo,
-                turma.local,
-                turma.status
-            ))
-            
-            sql_horario = """
-                INSERT INTO horario_turma(turma_id, dia, intervalo) 
-                VALUES (?, ?, ?)
-            """
-            
-            dados_horarios = []
-            for dia, intervalo in turma.horarios.items():
-                dados_horarios.append((turma.id, dia, intervalo))
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                cursor.execute(sql_turma, (
+                    turma.id, 
+                    turma.periodo, 
+                    turma.vagas, 
+                    turma.curso.codigo,
+                    turma.local,
+                    turma.status
+                ))
+                
+                sql_horario = """
+                    INSERT INTO horario_turma(turma_id, dia, intervalo) 
+                    VALUES (?, ?, ?)
+                """
+                
+                dados_horarios = []
+                for dia, intervalo in turma.horarios.items():
+                    dados_horarios.append((turma.id, dia, intervalo))
 
-            if dados_horarios:
-                self.cursor.executemany(sql_horario, dados_horarios)
+                if dados_horarios:
+                    cursor.executemany(sql_horario, dados_horarios)
 
-            self.conn.commit()
-            return True
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao criar turma: {str(e)}")
+                return True
+            except Exception as e:
+                raise ValueError(f"Erro ao criar turma: {str(e)}")
     
     def get_by_id(self, turma_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -70,8 +66,9 @@ class TurmaRepository:
             WHERE id = ?
         """
         
-        self.cursor.execute(sql_turma, (turma_id,))
-        row = self.cursor.fetchone()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql_turma, (turma_id,))
+            row = cursor.fetchone()
 
         if row is None:
             return None
@@ -83,8 +80,9 @@ class TurmaRepository:
             WHERE turma_id = ?
             ORDER BY dia
         """
-        self.cursor.execute(sql_horarios, (turma_id,))
-        horarios_rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql_horarios, (turma_id,))
+            horarios_rows = cursor.fetchall()
 
         horarios_dict = {}
         for h in horarios_rows:
@@ -116,8 +114,9 @@ class TurmaRepository:
             ORDER BY periodo DESC, id
         """
         
-        self.cursor.execute(sql_turmas)
-        turmas_rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql_turmas)
+            turmas_rows = cursor.fetchall()
 
         if not turmas_rows:
             return []
@@ -132,8 +131,9 @@ class TurmaRepository:
             WHERE turma_id IN ({placeholders})
             ORDER BY turma_id, dia
         """
-        self.cursor.execute(sql_horarios, turma_ids)
-        horarios_rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql_horarios, turma_ids)
+            horarios_rows = cursor.fetchall()
         
         # Organizar horários por turma
         horarios_por_turma = {}
@@ -171,25 +171,20 @@ class TurmaRepository:
         Returns:
             True se deletada, False caso contrário.
         """
-        try:
-            # Primeiro deletar horários
-            sql_horarios = "DELETE FROM horario_turma WHERE turma_id = ?"
-            self.cursor.execute(sql_horarios, (turma_id,))
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                # Primeiro deletar horários
+                sql_horarios = "DELETE FROM horario_turma WHERE turma_id = ?"
+                cursor.execute(sql_horarios, (turma_id,))
 
-            # Depois deletar a turma
-            sql_turma = "DELETE FROM turma WHERE id = ?"
-            self.cursor.execute(sql_turma, (turma_id,))
-            
-            self.conn.commit()
-            
-            # Verificar se alguma linha foi afetada
-            self.cursor.execute("SELECT changes();")
-            alterados = self.cursor.fetchone()[0]
-            
-            return alterados > 0
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao deletar turma: {str(e)}")
+                # Depois deletar a turma
+                sql_turma = "DELETE FROM turma WHERE id = ?"
+                cursor.execute(sql_turma, (turma_id,))
+                alterados = cursor.rowcount
+                
+                return alterados > 0
+            except Exception as e:
+                raise ValueError(f"Erro ao deletar turma: {str(e)}")
     
     def update(self, turma_id: str, dados: Dict[str, Any]) -> bool:
         """
@@ -205,86 +200,80 @@ class TurmaRepository:
         if not dados:
             return False
         
-        try:
-            alterado = False
-            
-            # Atualizar dados básicos da turma
-            campos_turma = []
-            valores_turma = []
-            
-            campos_validos_turma = ['periodo', 'vagas', 'local', 'status']
-            for campo, valor in dados.items():
-                if campo in campos_validos_turma:
-                    campos_turma.append(f"{campo} = ?")
-                    valores_turma.append(valor)
-            
-            if campos_turma:
-                sql_turma = f"""
-                    UPDATE turma
-                    SET {", ".join(campos_turma)}
-                    WHERE id = ?
-                """
-                valores_turma.append(turma_id)
-                self.cursor.execute(sql_turma, tuple(valores_turma))
-                alterado = True
-            
-            # Atualizar horários se fornecidos
-            if "horarios" in dados:
-                novos_horarios = dados["horarios"]
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                # Linhas afetadas pelo último INSERT/UPDATE/DELETE executado
+                alterados = 0
                 
-                # Buscar horários existentes
-                sql_existentes = """
-                    SELECT dia, intervalo 
-                    FROM horario_turma 
-                    WHERE turma_id = ?
-                """
-                self.cursor.execute(sql_existentes, (turma_id,))
-                existentes_rows = self.cursor.fetchall()
-                existentes = {h["dia"]: h["intervalo"] for h in existentes_rows}
+                # Atualizar dados básicos da turma
+                campos_turma = []
+                valores_turma = []
                 
-                # Atualizar ou adicionar novos horários
-                for dia, intervalo in novos_horarios.items():
-                    if dia in existentes:
-                        if existentes[dia] != intervalo:
-                            sql_atualizar = """
-                                UPDATE horario_turma
-                                SET intervalo = ?
-                                WHERE turma_id = ? AND dia = ?
-                            """
-                            self.cursor.execute(sql_atualizar, (intervalo, turma_id, dia))
-                            alterado = True
-                    else:
-                        sql_inserir = """
-                            INSERT INTO horario_turma (dia, intervalo, turma_id)
-                            VALUES (?, ?, ?)
-                        """
-                        self.cursor.execute(sql_inserir, (dia, intervalo, turma_id))
-                        alterado = True
+                campos_validos_turma = ['periodo', 'vagas', 'local', 'status']
+                for campo, valor in dados.items():
+                    if campo in campos_validos_turma:
+                        campos_turma.append(f"{campo} = ?")
+                        valores_turma.append(valor)
                 
-                # Remover horários que não estão mais na lista
-                dias_novos = set(novos_horarios.keys())
-                dias_existentes = set(existentes.keys())
-                dias_para_remover = dias_existentes - dias_novos
+                if campos_turma:
+                    sql_turma = f"""
+                        UPDATE turma
+                        SET {", ".join(campos_turma)}
+                        WHERE id = ?
+                    """
+                    valores_turma.append(turma_id)
+                    cursor.execute(sql_turma, tuple(valores_turma))
+                    alterados = cursor.rowcount
                 
-                for dia in dias_para_remover:
-                    sql_remover = """
-                        DELETE FROM horario_turma
-                        WHERE turma_id = ? AND dia = ?
+                # Atualizar horários se fornecidos
+                if "horarios" in dados:
+                    novos_horarios = dados["horarios"]
+                    
+                    # Buscar horários existentes
+                    sql_existentes = """
+                        SELECT dia, intervalo 
+                        FROM horario_turma 
+                        WHERE turma_id = ?
                     """
-                    self.cursor.execute(sql_remover, (turma_id, dia))
-                    alterado = True
-            
-            self.conn.commit()
-            
-            if alterado:
-                self.cursor.execute("SELECT changes();")
-                alterados = self.cursor.fetchone()[0]
+                    cursor.execute(sql_existentes, (turma_id,))
+                    existentes_rows = cursor.fetchall()
+                    existentes = {h["dia"]: h["intervalo"] for h in existentes_rows}
+                    
+                    # Atualizar ou adicionar novos horários
+                    for dia, intervalo in novos_horarios.items():
+                        if dia in existentes:
+                            if existentes[dia] != intervalo:
+                                sql_atualizar = """
+                                    UPDATE horario_turma
+                                    SET intervalo = ?
+                                    WHERE turma_id = ? AND dia = ?
+                                """
+                                cursor.execute(sql_atualizar, (intervalo, turma_id, dia))
+                                alterados = cursor.rowcount
+                        else:
+                            sql_inserir = """
+                                INSERT INTO horario_turma (dia, intervalo, turma_id)
+                                VALUES (?, ?, ?)
+                            """
+                            cursor.execute(sql_inserir, (dia, intervalo, turma_id))
+                            alterados = cursor.rowcount
+                    
+                    # Remover horários que não estão mais na lista
+                    dias_novos = set(novos_horarios.keys())
+                    dias_existentes = set(existentes.keys())
+                    dias_para_remover = dias_existentes - dias_novos
+                    
+                    for dia in dias_para_remover:
+                        sql_remover = """
+                            DELETE FROM horario_turma
+                            WHERE turma_id = ? AND dia = ?
+                        """
+                        cursor.execute(sql_remover, (turma_id, dia))
+                        alterados = cursor.rowcount
+                
                 return alterados > 0
-            
-            return False
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar turma: {str(e)}")
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar turma: {str(e)}")
     
     def buscar_por_periodo(self, periodo: str) -> List[Dict[str, Any]]:
         """
@@ -303,8 +292,9 @@ class TurmaRepository:
             ORDER BY id
         """
         
-        self.cursor.execute(sql, (periodo,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (periodo,))
+            rows = cursor.fetchall()
         
         if not rows:
             return []
@@ -330,8 +320,9 @@ class TurmaRepository:
             ORDER BY periodo DESC, id
         """
         
-        self.cursor.execute(sql, (curso_codigo,))
-        rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql, (curso_codigo,))
+            rows = cursor.fetchall()
         
         if not rows:
             return []
@@ -362,8 +353,9 @@ class TurmaRepository:
             WHERE turma_id IN ({placeholders})
             ORDER BY turma_id, dia
         """
-        self.cursor.execute(sql_horarios, turma_ids)
-        horarios_rows = self.cursor.fetchall()
+        with SQLiteConnection.acquire_read() as (conn, cursor):
+            cursor.execute(sql_horarios, turma_ids)
+            horarios_rows = cursor.fetchall()
         
         # Organizar horários por turma
         horarios_por_turma = {}
@@ -390,22 +382,21 @@ class TurmaRepository:
         return turmas_completas
 
     def open(self, turma_id, tipo: str):
-        try:
-            sql = "SELECT status FROM turma WHERE id = ?"
-            self.cursor.execute(sql, (turma_id,))
-            row = self.cursor.fetchone()  
-            
-            if not row:  
-                raise ValueError(f"Turma {turma_id} não encontrada")
-            
-            new_status = True if tipo=="abrir" else False
-            
-            sql = "UPDATE turma SET status = ? WHERE id = ?"
-            self.cursor.execute(sql, (new_status, turma_id))
-            
-            self.conn.commit()
-            return new_status 
-            
-        except Exception as e:
-            self.conn.rollback()
-            raise ValueError(f"Erro ao atualizar status da turma: {str(e)}")
\ No newline at end of file
+        with SQLiteConnection.acquire_write() as (conn, cursor):
+            try:
+                sql = "SELECT status FROM turma WHERE id = ?"
+                cursor.execute(sql, (turma_id,))
+                row = cursor.fetchone()  
+                
+                if not row:  
+                    raise ValueError(f"Turma {turma_id} não encontrada")
+                
+                new_status = True if tipo=="abrir" else False
+                
+                sql = "UPDATE turma SET status = ? WHERE id = ?"
+                cursor.execute(sql, (new_status, turma_id))
+                
+                return new_status 
+                
+            except Exception as e:
+                raise ValueError(f"Erro ao atualizar status da turma: {str(e)}")
\ No newline at end of file
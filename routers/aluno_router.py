@@ -92,7 +92,7 @@ def obter_cr_aluno(matricula: str):
     """
     Obtém o CR de um aluno.
     """
-    aluno = service.buscar_aluno(matricula)
+    aluno = service.buscar_aluno(matricula, incluir_historico=False)
     if not aluno:
         raise HTTPException(status_code=404, detail="Aluno não encontrado")
     
@@ -255,7 +255,7 @@ def recalcular_cr_aluno(matricula: str):
         if not atualizado:
             raise HTTPException(status_code=404, detail="Aluno não encontrado")
         
-        aluno = service.buscar_aluno(matricula)
+        aluno = service.buscar_aluno(matricula, incluir_historico=False)
         return {
             "message": "CR recalculado com sucesso!",
             "matricula": matricula,
@@ -3,6 +3,11 @@ from typing import Dict, Optional, List
 from datetime import time
 
 
+# Montados uma vez: a ordem é a da mensagem de erro, o frozenset serve à validação
+_DIAS_VALIDOS = ("seg", "ter", "qua", "qui", "sex", "sab", "dom")
+_CONJUNTO_DIAS_VALIDOS = frozenset(_DIAS_VALIDOS)
+
+
 class TurmaBase(BaseModel):
     periodo: str = Field(..., min_length=6, max_length=7, description="Período letivo (ex: 2025.1)")
     vagas: int = Field(..., gt=0, description="Quantidade máxima de vagas")
@@ -32,12 +37,10 @@ class TurmaBase(BaseModel):
         if not v:
             raise ValueError("A turma deve ter pelo menos um horário")
         
-        dias_validos = ["seg", "ter", "qua", "qui", "sex", "sab", "dom"]
-        
         for dia, intervalo in v.items():
             dia_lower = dia.lower()
-            if dia_lower not in dias_validos:
-                raise ValueError(f"Dia inválido: {dia}. Use: {', '.join(dias_validos)}")
+            if dia_lower not in _CONJUNTO_DIAS_VALIDOS:
+                raise ValueError(f"Dia inválido: {dia}. Use: {', '.join(_DIAS_VALIDOS)}")
             
             # Validar formato do intervalo
             try:
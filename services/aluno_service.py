@@ -1,5 +1,7 @@
 # services/aluno_service.py
-from typing import List, Optional, Dict, Any
+import heapq
+from typing import Iterable, List, Optional, Dict, Any
+from operator import attrgetter
 from models.aluno import Aluno
 from repositories.aluno_repository import AlunoRepository
 from schemas.aluno_schema import AlunoSchema, UpdateAlunoSchema
@@ -14,6 +16,12 @@ class AlunoService:
         """
         Cria um novo aluno.
         
+        Com histórico inicial, os registros são validados e normalizados pelo
+        modelo (nota/frequência em float, situação em maiúsculas, data de
+        registro) antes de gravados, e o CR retornado e gravado é o calculado
+        a partir deles, no lugar do `cr` informado. Sem histórico, o `cr`
+        informado é mantido.
+        
         Args:
             aluno_data: Dados do aluno a ser criado.
             
@@ -33,28 +41,32 @@ class AlunoService:
             cr=aluno_data.cr if aluno_data.cr is not None else 0.0
         )
         
-        self.repository.salvar(aluno_data)
+        # Validar o histórico inicial inteiro antes de gravar (CR calculado uma vez)
+        registros = aluno.adicionar_ao_historico_lote(aluno_data.historico) if aluno_data.historico else []
         
-        if aluno_data.historico:
-            for registro in aluno_data.historico:
-                self.repository.adicionar_historico(
-                    aluno_data.matricula,
-                    registro
-                )
+        # Aluno, histórico inicial e CR gravados em uma única transação
+        with self.repository.transacao():
+            self.repository.salvar(aluno_data)
+            
+            if registros:
+                self.repository.adicionar_historico_lote(aluno_data.matricula, registros)
+                self.repository.atualizar_cr_aluno(aluno_data.matricula)
         
         return aluno
     
-    def buscar_aluno(self, matricula: str) -> Optional[Aluno]:
+    def buscar_aluno(self, matricula: str, incluir_historico: bool = True) -> Optional[Aluno]:
         """
         Busca um aluno pela matrícula.
         
         Args:
             matricula: Matrícula do aluno.
+            incluir_historico: Se False, o aluno vem sem histórico (uma consulta a
+                menos); o CR é o gravado no banco.
             
         Returns:
             Objeto Aluno se encontrado, None caso contrário.
         """
-        aluno_data = self.repository.buscar_por_matricula(matricula)
+        aluno_data = self.repository.buscar_por_matricula(matricula, incluir_historico)
         if not aluno_data:
             return None
         
@@ -69,6 +81,27 @@ class AlunoService:
         
         return aluno
     
+    def buscar_alunos(self, matriculas: Iterable[str]) -> Dict[str, Aluno]:
+        """
+        Busca vários alunos de uma vez.
+        
+        Args:
+            matriculas: Matrículas dos alunos.
+            
+        Returns:
+            Dicionário matrícula -> Aluno, apenas com os alunos encontrados.
+        """
+        return {
+            matricula: Aluno(
+                matricula=aluno_data.matricula,
+                nome=aluno_data.nome,
+                email=aluno_data.email,
+                cr=aluno_data.cr,
+                historico=aluno_data.historico
+            )
+            for matricula, aluno_data in self.repository.buscar_muitos_por_matricula(matriculas).items()
+        }
+    
     def listar_alunos(self, ordenar_por_cr: bool = False) -> List[Aluno]:
         """
         Lista todos os alunos.
@@ -79,11 +112,11 @@ class AlunoService:
         Returns:
             Lista de objetos Aluno.
         """
-        alunos_data = self.repository.listar()
-        
-        # Converter schemas para objetos Aluno
+        # Converter schemas para objetos Aluno à medida que são lidos do banco,
+        # sem manter a lista intermediária de schemas; o histórico não é usado
+        # aqui, então nem é consultado
         alunos = []
-        for aluno_data in alunos_data:
+        for aluno_data in self.repository.iter_alunos(incluir_historico=False):
             aluno = Aluno(
                 matricula=aluno_data.matricula,
                 nome=aluno_data.nome,
@@ -94,7 +127,8 @@ class AlunoService:
         
         # Ordenar se solicitado
         if ordenar_por_cr:
-            alunos.sort()
+            # A chave é calculada uma vez por aluno, e não a cada comparação
+            alunos.sort(key=attrgetter('chave_ordenacao'))
         
         return alunos
     
@@ -185,8 +219,8 @@ class AlunoService:
         Returns:
             Lista dos N melhores alunos por CR.
         """
-        alunos = self.listar_alunos(ordenar_por_cr=True)
-        return alunos[:n]
+        # Seleção parcial O(n log k): mesmo resultado de ordenar tudo e fatiar
+        return heapq.nsmallest(n, self.listar_alunos(), key=attrgetter('chave_ordenacao'))
     
     def adicionar_ao_historico(self, aluno_matricula: str, historico_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -221,12 +255,11 @@ class AlunoService:
             semestre=historico_data.get('semestre')
         )
         
-        # Persistir no banco
-        registro_id = self.repository.adicionar_historico(aluno_matricula, registro)
-        registro['id'] = registro_id
-        
-        # Atualizar CR no banco
-        self.repository.atualizar_cr_aluno(aluno_matricula)
+        # Persistir o registro e o CR atualizado em uma única transação
+        with self.repository.transacao():
+            registro_id = self.repository.adicionar_historico(aluno_matricula, registro)
+            registro['id'] = registro_id
+            self.repository.atualizar_cr_aluno(aluno_matricula)
         
         return registro
     
@@ -274,11 +307,11 @@ class AlunoService:
         if not atualizado:
             return False
         
-        # Persistir no banco
-        atualizado = self.repository.atualizar_historico(registro_id, dados)
-        if atualizado:
-            # Atualizar CR no banco
-            self.repository.atualizar_cr_aluno(registro['aluno_matricula'])
+        # Persistir no banco (registro e CR na mesma transação)
+        with self.repository.transacao():
+            atualizado = self.repository.atualizar_historico(registro_id, dados)
+            if atualizado:
+                self.repository.atualizar_cr_aluno(registro['aluno_matricula'])
         
         return atualizado
     
@@ -297,11 +330,11 @@ class AlunoService:
         if not registro:
             return False
         
-        # Remover do banco
-        removido = self.repository.remover_historico(registro_id)
-        if removido:
-            # Atualizar CR do aluno
-            self.repository.atualizar_cr_aluno(registro['aluno_matricula'])
+        # Remover do banco e atualizar o CR na mesma transação
+        with self.repository.transacao():
+            removido = self.repository.remover_historico(registro_id)
+            if removido:
+                self.repository.atualizar_cr_aluno(registro['aluno_matricula'])
         
         return removido
     
@@ -316,8 +349,8 @@ class AlunoService:
         Returns:
             Dicionário com código do curso como chave e booleano como valor.
         """
-        aluno = self.buscar_aluno(matricula)
-        if not aluno:
+        # Só a existência importa aqui: a aprovação é consultada no banco
+        if not self.repository.existe_matricula(matricula):
             raise ValueError(f"Aluno {matricula} não encontrado.")
         
         resultados = {}
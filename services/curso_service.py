@@ -209,14 +209,7 @@ class CursoService:
         """
 
         curso_prerequisito = self.obter_prerequisitos(novo_prerequisito)
-        print(curso_prerequisito)
-
-        if curso_codigo in curso_prerequisito:
-            print("ffalse")
-            return True
-        else:
-            print("true")
-            return False
+        return curso_codigo in curso_prerequisito
     
     def remover_prerequisito(self, curso_codigo: str, prerequisito_codigo: str) -> bool:
         """
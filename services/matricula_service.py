@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import List, Optional, Dict, Any, Tuple
 from models.matricula import Matricula
 from models.aluno import Aluno
@@ -75,11 +76,12 @@ class MatriculaService:
             raise ValueError(f"Matrícula não permitida: {validacao['mensagem']}")
         
         # 5. Verificar limite de turmas por aluno (se configurado)
-        if self.settings.max_turmas_por_aluno > 0:
+        max_turmas = self.settings.max_turmas_por_aluno
+        if max_turmas > 0:
             matriculas_ativas = self.repository.count_matriculas_por_aluno(aluno_matricula, turma.periodo)
-            if matriculas_ativas >= self.settings.max_turmas_por_aluno:
+            if matriculas_ativas >= max_turmas:
                 raise ValueError(
-                    f"Aluno já atingiu o limite de {self.settings.max_turmas_por_aluno} "
+                    f"Aluno já atingiu o limite de {max_turmas} "
                     f"turmas no período {turma.periodo}."
                 )
         
@@ -259,9 +261,14 @@ class MatriculaService:
         else:
             matriculas_data = self.repository.get_all()
         
+        # Alunos buscados de uma vez, em vez de uma consulta por matrícula
+        alunos = self.aluno_service.buscar_alunos(
+            matricula_data['aluno_matricula'] for matricula_data in matriculas_data
+        )
+        
         matriculas = []
         for matricula_data in matriculas_data:
-            aluno = self.aluno_service.buscar_aluno(matricula_data['aluno_matricula'])
+            aluno = alunos.get(matricula_data['aluno_matricula'])
             turma = self.turma_service.buscar_turma(matricula_data['turma_id'])
             
             if aluno and turma:
@@ -405,31 +412,39 @@ class MatriculaService:
         
         matriculas = self.listar_matriculas(turma_id=turma_id)
         
-        # Estatísticas básicas
+        # Estatísticas básicas, situações e somas de notas/frequências em uma passada
         total_matriculas = len(matriculas)
-        matriculas_ativas = sum(1 for m in matriculas if m.ativa)
-        matriculas_concluidas = total_matriculas - matriculas_ativas
-        
-        # Distribuição de notas
-        notas = [m.nota for m in matriculas if m.nota is not None]
-        frequencias = [m.frequencia for m in matriculas if m.frequencia is not None]
-        
-        # Situações
-        situacoes = {}
+        matriculas_ativas = 0
+        soma_notas = qtd_notas = 0
+        soma_frequencias = qtd_frequencias = 0
+        situacoes = Counter()
         for matricula in matriculas:
-            situacao = matricula.situacao
-            situacoes[situacao] = situacoes.get(situacao, 0) + 1
+            if matricula.ativa:
+                matriculas_ativas += 1
+            nota = matricula.nota
+            if nota is not None:
+                soma_notas += nota
+                qtd_notas += 1
+            frequencia = matricula.frequencia
+            if frequencia is not None:
+                soma_frequencias += frequencia
+                qtd_frequencias += 1
+            situacoes[matricula.situacao] += 1
+        matriculas_concluidas = total_matriculas - matriculas_ativas
         
         # Taxa de aprovação
-        aprovados = situacoes.get(Matricula.SITUACAO_APROVADO, 0)
-        total_concluido = sum(count for situacao, count in situacoes.items() 
-                             if situacao != Matricula.SITUACAO_CURSANDO)
+        aprovados = situacoes[Matricula.SITUACAO_APROVADO]
+        total_concluido = total_matriculas - situacoes[Matricula.SITUACAO_CURSANDO]
         
-        taxa_aprovacao = round((aprovados / total_concluido * 100), 2) if total_concluido > 0 else 0.0
+        # Centésimos de ponto percentual em aritmética inteira, arredondando ao mais próximo
+        taxa_aprovacao = (
+            ((aprovados * 20000 + total_concluido) // (2 * total_concluido)) / 100
+            if total_concluido > 0 else 0.0
+        )
         
         # Cálculos de notas
-        media_notas = round(sum(notas) / len(notas), 2) if notas else None
-        media_frequencias = round(sum(frequencias) / len(frequencias), 2) if frequencias else None
+        media_notas = round(soma_notas / qtd_notas, 2) if qtd_notas else None
+        media_frequencias = round(soma_frequencias / qtd_frequencias, 2) if qtd_frequencias else None
         
         return {
             'turma_id': turma_id,
@@ -439,7 +454,7 @@ class MatriculaService:
             'total_matriculas': total_matriculas,
             'matriculas_ativas': matriculas_ativas,
             'matriculas_concluidas': matriculas_concluidas,
-            'situacoes': situacoes,
+            'situacoes': dict(situacoes),
             'taxa_aprovacao': taxa_aprovacao,
             'media_notas': media_notas,
             'media_frequencias': media_frequencias,
@@ -457,23 +472,35 @@ class MatriculaService:
             Lista de alunos em risco.
         """
         alunos_em_risco = []
+        # Limites lidos uma vez para o relatório inteiro, fora do laço
+        nota_minima = self.settings.nota_minima_aprovacao
+        frequencia_minima = self.settings.frequencia_minima
         
         for matricula in matriculas:
-            if matricula.ativa and matricula.nota is not None and matricula.frequencia is not None:
-                nota_minima = self.settings.nota_minima_aprovacao
-                frequencia_minima = self.settings.frequencia_minima
-                
-                if matricula.nota < nota_minima or matricula.frequencia < frequencia_minima:
-                    alunos_em_risco.append({
-                        'aluno_matricula': matricula.aluno.matricula,
-                        'aluno_nome': matricula.aluno.nome,
-                        'nota_atual': matricula.nota,
-                        'frequencia_atual': matricula.frequencia,
-                        'nota_minima': nota_minima,
-                        'frequencia_minima': frequencia_minima,
-                        'risco_nota': matricula.nota < nota_minima,
-                        'risco_frequencia': matricula.frequencia < frequencia_minima
-                    })
+            # Matrículas encerradas ou sem avaliação completa saem antes de qualquer comparação
+            if not matricula.ativa:
+                continue
+            nota = matricula.nota
+            frequencia = matricula.frequencia
+            if nota is None or frequencia is None:
+                continue
+            
+            # Cada comparação é feita uma vez e reaproveitada no registro
+            risco_nota = nota < nota_minima
+            risco_frequencia = frequencia < frequencia_minima
+            
+            if risco_nota or risco_frequencia:
+                aluno = matricula.aluno
+                alunos_em_risco.append({
+                    'aluno_matricula': aluno.matricula,
+                    'aluno_nome': aluno.nome,
+                    'nota_atual': nota,
+                    'frequencia_atual': frequencia,
+                    'nota_minima': nota_minima,
+                    'frequencia_minima': frequencia_minima,
+                    'risco_nota': risco_nota,
+                    'risco_frequencia': risco_frequencia
+                })
         
         return alunos_em_risco
     
@@ -490,32 +517,26 @@ class MatriculaService:
         # Esta é uma implementação básica
         # Em uma implementação real, buscaria dados mais completos do banco
         
+        # Uma única listagem alimenta todos os contadores do relatório
+        matriculas = self.listar_matriculas()
+        total = len(matriculas)
+        ativas = sum(1 for m in matriculas if m.ativa)
+        
         return {
             'periodo': periodo or 'Todos',
-            'total_matriculas': self._contar_matriculas(periodo),
-            'matriculas_ativas': self._contar_matriculas_ativas(periodo),
-            'taxa_conclusao': self._calcular_taxa_conclusao(periodo),
+            'total_matriculas': total,
+            'matriculas_ativas': ativas,
+            'taxa_conclusao': self._calcular_taxa_conclusao(total, ativas),
             'top_cursos': self._obter_top_cursos(periodo)
         }
     
-    def _contar_matriculas(self, periodo: Optional[str] = None) -> int:
-        """Conta total de matrículas."""
-        # Implementação simplificada
-        return len(self.listar_matriculas())
-    
-    def _contar_matriculas_ativas(self, periodo: Optional[str] = None) -> int:
-        """Conta matrículas ativas."""
-        matriculas = self.listar_matriculas()
-        return sum(1 for m in matriculas if m.ativa)
-    
-    def _calcular_taxa_conclusao(self, periodo: Optional[str] = None) -> float:
-        """Calcula taxa de conclusão."""
-        matriculas = self.listar_matriculas()
-        if not matriculas:
+    def _calcular_taxa_conclusao(self, total: int, ativas: int) -> float:
+        """Calcula taxa de conclusão a partir do total e das matrículas ativas."""
+        if not total:
             return 0.0
         
-        concluidas = sum(1 for m in matriculas if not m.ativa)
-        return round((concluidas / len(matriculas)) * 100, 2)
+        # Mesmo cálculo inteiro da taxa de aprovação (centésimos, ao mais próximo)
+        return (((total - ativas) * 20000 + total) // (2 * total)) / 100
     
     def _obter_top_cursos(self, periodo: Optional[str] = None) -> List[Dict[str, Any]]:
         """Obtém cursos com mais matrículas."""
@@ -0,0 +1,26 @@
+import pytest
+
+from database.connection import SQLiteConnection
+from database.setup import create_tables
+
+
+@pytest.fixture
+def banco_temporario(tmp_path, monkeypatch):
+    # Banco novo e isolado por teste (não toca no banco_dados.db do projeto)
+    SQLiteConnection.close_connection()
+    monkeypatch.setattr(SQLiteConnection, "_database_file", str(tmp_path / "banco_teste.db"))
+    create_tables()
+    yield
+    SQLiteConnection.close_connection()
+
+
+@pytest.fixture
+def cursos_no_banco(banco_temporario):
+    # historico_aluno referencia curso(codigo)
+    codigos = ["C1", "C2", "C3", "C4"]
+    with SQLiteConnection.acquire_write() as (conn, cursor):
+        cursor.executemany(
+            "INSERT INTO curso(codigo, nome, carga_horaria) VALUES (?, ?, 60)",
+            [(codigo, f"Curso {codigo}") for codigo in codigos]
+        )
+    return codigos
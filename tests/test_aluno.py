@@ -0,0 +1,191 @@
+import pytest
+
+from models.aluno import Aluno
+
+
+def _historico():
+    return [
+        {"codigo_curso": "C1", "nota": 8.0, "frequencia": 90, "carga_horaria": 60, "situacao": "APROVADO"},
+        {"codigo_curso": "C2", "nota": 4.5, "frequencia": 80, "carga_horaria": 30, "situacao": "REPROVADO_POR_NOTA"},
+        {"codigo_curso": "C3", "nota": 2.0, "frequencia": 40, "carga_horaria": 60, "situacao": "REPROVADO_POR_FREQUENCIA"},
+        # Carga 0 só entra via carregar_historico (adicionar_ao_historico rejeita)
+        {"codigo_curso": "C4", "nota": 10.0, "frequencia": 100, "carga_horaria": 0, "situacao": "APROVADO"},
+        {"codigo_curso": "C5", "nota": 7.125, "frequencia": 95, "carga_horaria": 45, "situacao": "APROVADO"},
+        {"codigo_curso": "C6", "nota": 9.0, "frequencia": 100, "carga_horaria": 60, "situacao": "CURSANDO"},
+    ]
+
+
+def _aluno():
+    aluno = Aluno("A1", "Ana", "ana@email.com")
+    aluno.carregar_historico(_historico())
+    return aluno
+
+
+def _cr_do_zero(aluno):
+    # Novo objeto com o mesmo histórico: calcula o CR sem passar pelos acumuladores
+    return Aluno("X", "X", "x@email.com", historico=[dict(r) for r in aluno.historico]).calcular_cr()
+
+
+def _assert_indice_consistente(aluno):
+    esperado = {}
+    for posicao, registro in enumerate(aluno.historico):
+        esperado.setdefault(registro["codigo_curso"], posicao)
+    assert aluno._indice == esperado
+
+
+@pytest.mark.parametrize("codigo, campos", [
+    ("C1", {"nota": 6.0}),
+    ("C1", {"situacao": "REPROVADO_POR_FREQUENCIA"}),
+    ("C3", {"situacao": "APROVADO"}),
+    ("C3", {"nota": 9.5, "situacao": "REPROVADO_POR_NOTA"}),
+    ("C4", {"nota": 0.0, "situacao": "REPROVADO_POR_NOTA"}),
+    ("C6", {"nota": 3.25, "situacao": "REPROVADO_POR_NOTA"}),
+    ("C5", {"situacao": "CURSANDO"}),
+])
+def test_atualizar_historico_cr_igual_ao_recalculo(codigo, campos):
+    aluno = _aluno()
+
+    assert aluno.atualizar_historico(codigo, **campos)
+
+    assert aluno.cr == _cr_do_zero(aluno)
+    assert aluno.cr == aluno.calcular_cr()
+
+
+@pytest.mark.parametrize("codigo", ["C1", "C2", "C3", "C4", "C5", "C6"])
+def test_remover_do_historico_cr_igual_ao_recalculo(codigo):
+    aluno = _aluno()
+
+    assert aluno.remover_do_historico(codigo)
+
+    assert codigo not in aluno.get_cursos_cursados()
+    assert aluno.cr == _cr_do_zero(aluno)
+    assert aluno.cr == aluno.calcular_cr()
+    _assert_indice_consistente(aluno)
+
+
+def test_sequencia_de_alteracoes_e_remocoes_mantem_cr_e_indice():
+    aluno = _aluno()
+
+    aluno.remover_do_historico("C3")
+    aluno.atualizar_historico("C4", situacao="REPROVADO_POR_NOTA", nota=1.0)
+    aluno.adicionar_ao_historico("C7", 6.5, 85, 30, "APROVADO")
+    aluno.remover_do_historico("C2")
+    aluno.atualizar_historico("C7", situacao="REPROVADO_POR_FREQUENCIA")
+    aluno.atualizar_historico("C6", nota=8.75, situacao="APROVADO")
+
+    assert [r["codigo_curso"] for r in aluno.historico] == ["C1", "C4", "C5", "C6", "C7"]
+    _assert_indice_consistente(aluno)
+    assert aluno.cr == _cr_do_zero(aluno)
+
+    # Removendo tudo o CR volta a zero
+    for codigo in ["C5", "C1", "C7", "C4", "C6"]:
+        aluno.remover_do_historico(codigo)
+        _assert_indice_consistente(aluno)
+        assert aluno.cr == _cr_do_zero(aluno)
+    assert aluno.cr == 0.0
+
+
+def test_remover_do_meio_mantem_atualizacao_dos_seguintes():
+    aluno = _aluno()
+
+    aluno.remover_do_historico("C3")
+
+    # C5 recuou uma posição; a atualização precisa atingir o registro certo
+    assert aluno.atualizar_historico("C5", nota=3.0)
+    assert next(r for r in aluno.historico if r["codigo_curso"] == "C5")["nota"] == 3.0
+    assert next(r for r in aluno.historico if r["codigo_curso"] == "C6")["nota"] == 9.0
+    assert aluno.cr == _cr_do_zero(aluno)
+    assert not aluno.remover_do_historico("C3")
+
+
+def test_to_dict_devolve_copia_do_historico():
+    aluno = _aluno()
+    cr = aluno.cr
+
+    dados = aluno.to_dict()
+    dados["historico"][0]["nota"] = 0.0
+    dados["historico"].pop()
+
+    assert len(aluno.historico) == len(_historico())
+    assert aluno.historico[0]["nota"] == 8.0
+    assert aluno.calcular_cr() == cr
+
+
+def test_comparacoes_consistentes_com_a_mesma_chave():
+    a = Aluno("A1", "Ana", "ana@email.com", cr=8.0)
+    b = Aluno("A2", "Ana", "ana2@email.com", cr=8.0)
+
+    assert not a < b and not b < a
+    assert not a > b and not b > a
+    assert a <= b and b <= a
+    assert a >= b and b >= a
+
+
+def test_comparacoes_seguem_cr_decrescente_e_nome():
+    melhor = Aluno("A1", "Bia", "bia@email.com", cr=9.0)
+    empate_nome_antes = Aluno("A2", "Ana", "ana@email.com", cr=7.0)
+    empate_nome_depois = Aluno("A3", "Caio", "caio@email.com", cr=7.0)
+    alunos = [empate_nome_depois, melhor, empate_nome_antes]
+
+    assert sorted(alunos) == [melhor, empate_nome_antes, empate_nome_depois]
+    assert sorted(alunos, reverse=True) == [empate_nome_depois, empate_nome_antes, melhor]
+    assert max(alunos) is empate_nome_depois
+    assert melhor < empate_nome_antes <= empate_nome_depois
+    assert empate_nome_depois > melhor and empate_nome_depois >= empate_nome_antes
+
+
+def test_historico_com_valores_em_texto():
+    registro = {"codigo_curso": "C1", "nota": "8.5", "frequencia": "90",
+                "carga_horaria": "60", "situacao": "APROVADO"}
+
+    aluno = Aluno("A1", "Ana", "ana@email.com", historico=[registro])
+
+    assert aluno.calcular_cr() == 8.5
+
+
+def test_historico_igual_a_sequencias():
+    aluno = Aluno("A1", "Ana", "ana@email.com")
+    assert aluno.historico == []
+    assert aluno.historico == ()
+
+    aluno.carregar_historico(_historico())
+
+    registros = [dict(r) for r in aluno.historico]
+    assert aluno.historico == registros
+    assert registros == aluno.historico
+    assert aluno.historico == aluno.historico
+    assert aluno.historico != []
+    assert aluno.historico != registros[:-1]
+
+
+def test_codigo_repetido_continua_aprovado_enquanto_houver_registro_aprovado():
+    # Histórico vindo do banco com o mesmo curso cursado duas vezes
+    aluno = Aluno("A1", "Ana", "ana@email.com")
+    aluno.carregar_historico([
+        {"codigo_curso": "C1", "nota": 3.0, "frequencia": 90, "carga_horaria": 60, "situacao": "REPROVADO_POR_NOTA"},
+        {"codigo_curso": "C2", "nota": 8.0, "frequencia": 90, "carga_horaria": 60, "situacao": "APROVADO"},
+        {"codigo_curso": "C1", "nota": 8.0, "frequencia": 90, "carga_horaria": 60, "situacao": "APROVADO"},
+    ])
+    assert aluno.curso_aprovado("C1")
+
+    # Atualiza a primeira ocorrência (reprovada): a segunda segue aprovada
+    aluno.atualizar_historico("C1", nota=2.0)
+    assert aluno.curso_aprovado("C1")
+
+    # Remove a primeira ocorrência: a aprovada passa a ser a indexada
+    aluno.remover_do_historico("C1")
+    assert aluno.curso_aprovado("C1")
+    _assert_indice_consistente(aluno)
+
+    aluno.atualizar_historico("C1", situacao="REPROVADO_POR_NOTA")
+    assert not aluno.curso_aprovado("C1")
+    assert aluno.cr == _cr_do_zero(aluno)
+
+
+def test_remover_unica_ocorrencia_aprovada_deixa_de_ser_aprovado():
+    aluno = _aluno()
+    assert aluno.curso_aprovado("C1")
+
+    aluno.remover_do_historico("C1")
+
+    assert not aluno.curso_aprovado("C1")
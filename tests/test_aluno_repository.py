@@ -1,6 +1,7 @@
 import pytest
 from repositories.aluno_repository import AlunoRepository
 from models.aluno import Aluno
+from schemas.aluno_schema import AlunoSchema
 
 @pytest.fixture
 def repo():
@@ -36,3 +37,141 @@ def test_deletar_aluno(repo):
     repo.deletar("20230001")
     aluno = repo.buscar_por_matricula("20230001")
     assert aluno is None
+
+
+def _registro(codigo_curso, nota, carga_horaria=60, situacao="APROVADO", frequencia=90):
+    return {
+        "codigo_curso": codigo_curso,
+        "nota": nota,
+        "frequencia": frequencia,
+        "carga_horaria": carga_horaria,
+        "situacao": situacao,
+        "semestre": "2024.1",
+    }
+
+
+def test_atualizar_cr_arredonda_como_o_modelo(cursos_no_banco):
+    repo = AlunoRepository()
+    repo.salvar(AlunoSchema(matricula="A1", nome="Ana", email="ana@email.com"))
+    # 7.125 é exato em binário: round() desempata para o par (7.12),
+    # o ROUND do SQLite daria 7.13
+    registro = _registro("C1", 7.125)
+    repo.adicionar_historico("A1", registro)
+
+    assert repo.atualizar_cr_aluno("A1") is True
+
+    aluno = Aluno("A1", "Ana", "ana@email.com", historico=[dict(registro)])
+    assert aluno.calcular_cr() == 7.12
+    assert repo.buscar_por_matricula("A1").cr == 7.12
+    assert repo.calcular_cr_aluno("A1") == 7.12
+
+
+def test_atualizar_cr_ignora_situacoes_e_carga_fora_do_cr(cursos_no_banco):
+    repo = AlunoRepository()
+    repo.salvar(AlunoSchema(matricula="A1", nome="Ana", email="ana@email.com"))
+    registros = [
+        _registro("C1", 8.0),
+        _registro("C2", 5.0, situacao="REPROVADO_POR_NOTA", carga_horaria=30),
+        _registro("C3", 1.0, situacao="REPROVADO_POR_FREQUENCIA", frequencia=10),
+        _registro("C4", 10.0, carga_horaria=0),
+    ]
+    repo.adicionar_historico_lote("A1", registros)
+
+    repo.atualizar_cr_aluno("A1")
+
+    aluno = Aluno("A1", "Ana", "ana@email.com", historico=[dict(r) for r in registros])
+    assert repo.buscar_por_matricula("A1").cr == aluno.calcular_cr() == round((8 * 60 + 5 * 30) / 90, 2)
+
+
+def test_atualizar_cr_aluno_inexistente(banco_temporario):
+    assert AlunoRepository().atualizar_cr_aluno("NAO_EXISTE") is False
+
+
+def test_transacao_desfaz_escritas_de_outros_repositorios(banco_temporario):
+    from repositories.curso_repository import CursoRepository
+    from schemas.curso_schema import CursoSchema
+    repo = AlunoRepository()
+    repo_curso = CursoRepository()
+
+    with pytest.raises(RuntimeError):
+        with repo.transacao():
+            repo_curso.create(CursoSchema(codigo="BD001", nome="Banco de Dados", carga_horaria=60))
+            repo.salvar(AlunoSchema(matricula="A1", nome="Ana", email="ana@email.com"))
+            raise RuntimeError("falha depois das escritas")
+
+    # Nenhuma escrita confirmou a transação externa no meio do bloco
+    assert repo_curso.get_by_codigo("BD001") is None
+    assert not repo.existe_matricula("A1")
+
+
+def test_buscar_muitos_por_matricula_em_varios_lotes(cursos_no_banco):
+    repo = AlunoRepository()
+    matriculas = [f"M{i:05d}" for i in range(1200)]
+    esperados = {}
+    with repo.transacao():
+        for i, matricula in enumerate(matriculas):
+            repo.salvar(AlunoSchema(matricula=matricula, nome=f"Aluno {i}", email=f"a{i}@email.com"))
+            # Quantidade e notas diferentes por aluno (alguns sem histórico)
+            registros = [_registro(codigo, (i + k) % 11) for k, codigo in enumerate(cursos_no_banco[:i % 5])]
+            repo.adicionar_historico_lote(matricula, registros)
+            esperados[matricula] = {r["codigo_curso"]: float(r["nota"]) for r in registros}
+
+    # Duplicatas e matrículas inexistentes espalhadas entre os lotes de 500
+    consulta = matriculas[::-1] + matriculas[:600] + ["NAO_EXISTE", "M99999", "NAO_EXISTE"]
+    alunos = repo.buscar_muitos_por_matricula(consulta)
+
+    assert set(alunos) == set(matriculas)
+    for matricula, aluno in alunos.items():
+        assert aluno.matricula == matricula
+        assert {r["codigo_curso"]: r["nota"] for r in aluno.historico} == esperados[matricula]
+        assert len(aluno.historico) == len(esperados[matricula])
+
+
+def test_buscar_muitos_por_matricula_vazio(banco_temporario):
+    assert AlunoRepository().buscar_muitos_por_matricula([]) == {}
+    assert AlunoRepository().buscar_muitos_por_matricula(["NAO_EXISTE"]) == {}
+
+
+def test_iter_alunos_sem_historico(cursos_no_banco):
+    repo = AlunoRepository()
+    repo.salvar(AlunoSchema(matricula="A1", nome="Ana", email="ana@email.com"))
+    repo.salvar(AlunoSchema(matricula="B2", nome="Bia", email="bia@email.com"))
+    repo.adicionar_historico_lote("A1", [_registro("C1", 8.0), _registro("C2", 6.0)])
+    repo.atualizar_cr_aluno("A1")
+
+    com_historico = list(repo.iter_alunos())
+    sem_historico = list(repo.iter_alunos(incluir_historico=False))
+
+    assert [a.matricula for a in sem_historico] == [a.matricula for a in com_historico] == ["A1", "B2"]
+    assert [a.cr for a in sem_historico] == [a.cr for a in com_historico] == [7.0, 0.0]
+    assert all(a.historico == [] for a in sem_historico)
+    assert len(com_historico[0].historico) == 2
+
+
+def test_iter_alunos_nao_prende_a_conexao_de_leitura(cursos_no_banco):
+    from database.connection import SQLiteConnection
+    repo = AlunoRepository()
+    matriculas = [f"M{i:04d}" for i in range(1100)]
+    with repo.transacao():
+        for i, matricula in enumerate(matriculas):
+            repo.salvar(AlunoSchema(matricula=matricula, nome=f"Aluno {i}", email=f"a{i}@email.com"))
+            repo.adicionar_historico_lote(matricula, [_registro(cursos_no_banco[i % 4], i % 11)])
+
+    for incluir_historico in (True, False):
+        gerador = repo.iter_alunos(incluir_historico=incluir_historico)
+        primeiro = next(gerador)
+        # Suspenso entre lotes: nenhum leitor emprestado nesta thread
+        assert getattr(SQLiteConnection._local, "reader", None) is None
+        # Outro gerador na mesma thread, intercalado com o primeiro
+        outro = repo.iter_alunos(incluir_historico=incluir_historico)
+        pares = list(zip(gerador, outro))
+        gerador.close()
+
+        lidos = [primeiro] + [a for a, _ in pares]
+        assert [a.matricula for a in lidos] == matriculas
+        assert [b.matricula for _, b in pares] == matriculas[:-1]
+        if incluir_historico:
+            assert all(a.historico[0]["codigo_curso"] == cursos_no_banco[i % 4]
+                       for i, a in enumerate(lidos))
+        else:
+            assert all(a.historico == [] for a in lidos)
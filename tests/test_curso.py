@@ -0,0 +1,74 @@
+from models.curso import Curso, MemoriaCiclos
+
+
+def test_to_dict_devolve_copia_dos_prerequisitos():
+    curso = Curso("C1", "Curso 1", 60, prerequisitos=["C0"])
+
+    dados = curso.to_dict()
+    dados["prerequisitos"].append("X")
+    dados["nome"] = "Outro"
+
+    assert curso.to_dict() == {
+        "codigo": "C1",
+        "nome": "Curso 1",
+        "carga_horaria": 60,
+        "ementa": "",
+        "prerequisitos": ["C0"],
+    }
+    assert curso.prerequisitos == ("C0",)
+    assert curso.to_dict()["prerequisitos"] is not curso.to_dict()["prerequisitos"]
+
+
+def test_to_dict_acompanha_alteracao_dos_prerequisitos():
+    curso = Curso("C1", "Curso 1", 60, prerequisitos=["C0"])
+    curso.to_dict()
+
+    curso.adicionar_prerequisito("C2")
+
+    assert curso.to_dict()["prerequisitos"] == ["C0", "C2"]
+
+
+def _grade(com_ciclo):
+    cursos = {
+        "A": Curso("A", "A", 60, prerequisitos=["B"]),
+        "B": Curso("B", "B", 60, prerequisitos=["C"]),
+        "C": Curso("C", "C", 60, prerequisitos=["A"] if com_ciclo else []),
+        "D": Curso("D", "D", 60),
+    }
+    return cursos
+
+
+def test_verificar_ciclo_sem_memoria():
+    sem_ciclo = _grade(False)
+    com_ciclo = _grade(True)
+
+    assert not any(c.verificar_ciclo_prerequisitos(sem_ciclo) for c in sem_ciclo.values())
+    assert com_ciclo["A"].verificar_ciclo_prerequisitos(com_ciclo)
+    assert not com_ciclo["D"].verificar_ciclo_prerequisitos(com_ciclo)
+    assert not hasattr(Curso, "_memo_ciclos")
+
+
+def test_memorias_de_dicionarios_diferentes_nao_se_misturam():
+    sem_ciclo, memoria_sem = _grade(False), MemoriaCiclos()
+    com_ciclo, memoria_com = _grade(True), MemoriaCiclos()
+
+    # Consultas intercaladas, na mesma versão do grafo
+    for codigo in "ABCD":
+        assert not sem_ciclo[codigo].verificar_ciclo_prerequisitos(sem_ciclo, memoria_sem)
+        esperado = codigo != "D"
+        assert com_ciclo[codigo].verificar_ciclo_prerequisitos(com_ciclo, memoria_com) is esperado
+
+    # A mesma memória passada para outro dicionário é descartada
+    assert com_ciclo["A"].verificar_ciclo_prerequisitos(com_ciclo, memoria_sem)
+    assert not sem_ciclo["A"].verificar_ciclo_prerequisitos(sem_ciclo, memoria_com)
+
+
+def test_memoria_descartada_quando_pre_requisitos_mudam():
+    cursos, memoria = _grade(False), MemoriaCiclos()
+    assert not cursos["A"].verificar_ciclo_prerequisitos(cursos, memoria)
+
+    cursos["C"].adicionar_prerequisito("A")
+    assert cursos["A"].verificar_ciclo_prerequisitos(cursos, memoria)
+
+    cursos["C"].remover_prerequisito("A")
+    assert not cursos["A"].verificar_ciclo_prerequisitos(cursos, memoria)
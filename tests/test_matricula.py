@@ -0,0 +1,82 @@
+import pytest
+
+from models.aluno import Aluno
+from models.curso import Curso
+from models.matricula import Matricula
+from models.turma import Turma
+
+
+def _matricula():
+    curso = Curso("POO006", "Programação Orientada a Objetos", 64, "classes, objetos... etc")
+    turma = Turma("TU1", "2026.1", {"ter": "18:00-22:00"}, 50, curso)
+    aluno = Aluno("2025001", "Ana", "ana@email.com")
+    return Matricula(aluno, turma)
+
+
+def test_to_dict_devolve_copia_da_info_avaliacao():
+    matricula = _matricula()
+    matricula.lancar_avaliacao(9.5, 78)
+
+    dados = matricula.to_dict()
+    dados["info_avaliacao"]["nota"] = 0.0
+    dados["info_avaliacao"]["aprovado"] = None
+
+    info = matricula.to_dict()["info_avaliacao"]
+    assert info["nota"] == 9.5
+    assert info["aprovado"] is not None
+    assert info is not dados["info_avaliacao"]
+
+
+def test_to_dict_sem_nota_nao_tem_info_avaliacao():
+    assert _matricula().to_dict()["info_avaliacao"] is None
+
+
+def _turma(codigo_curso):
+    curso = Curso(codigo_curso, f"Curso {codigo_curso}", 64)
+    return Turma(f"T{codigo_curso}", "2026.1", {"ter": "18:00-22:00"}, 50, curso)
+
+
+def test_lancar_avaliacoes_lote_falha_no_meio_nao_altera_nada():
+    turma = _turma("C1")
+    ana = Aluno("A1", "Ana", "ana@email.com")
+    bia = Aluno("B2", "Bia", "bia@email.com")
+    caio = Aluno("C3", "Caio", "caio@email.com")
+    # Bia já tem o curso no histórico: o terceiro item do lote falharia
+    bia.adicionar_ao_historico("C1", 7.0, 90, 64, "APROVADO")
+    matriculas = [Matricula(ana, turma), Matricula(caio, turma), Matricula(bia, turma)]
+
+    with pytest.raises(ValueError):
+        Matricula.lancar_avaliacoes_lote(matriculas, [8.0, 9.0, 5.0], [90, 95, 80])
+
+    for matricula in matriculas:
+        assert matricula.nota is None and matricula.frequencia is None
+        assert matricula.ativa
+        assert matricula.situacao == Matricula.SITUACAO_CURSANDO
+    assert len(ana.historico) == 0 and len(caio.historico) == 0
+    assert len(bia.historico) == 1
+
+
+def test_lancar_avaliacoes_lote_aluno_repetido_no_mesmo_curso():
+    ana = Aluno("A1", "Ana", "ana@email.com")
+    outro_curso = Matricula(ana, _turma("C2"))
+    primeira = Matricula(ana, _turma("C1"))
+    repetida = Matricula(ana, _turma("C1"))
+
+    with pytest.raises(ValueError):
+        Matricula.lancar_avaliacoes_lote([outro_curso, primeira, repetida], [8.0, 9.0, 5.0], [90, 95, 80])
+
+    assert all(m.nota is None for m in (outro_curso, primeira, repetida))
+    assert len(ana.historico) == 0
+
+
+def test_lancar_avaliacoes_lote_registra_todos():
+    ana = Aluno("A1", "Ana", "ana@email.com")
+    bia = Aluno("B2", "Bia", "bia@email.com")
+    turma = _turma("C1")
+    matriculas = [Matricula(ana, turma), Matricula(bia, turma), Matricula(ana, _turma("C2"))]
+
+    Matricula.lancar_avaliacoes_lote(matriculas, [8.0, 9.0, 6.5], [90, 95, 80])
+
+    assert all(not m.ativa for m in matriculas)
+    assert ana.get_cursos_cursados() == ["C1", "C2"]
+    assert bia.get_cursos_cursados() == ["C1"]
@@ -0,0 +1,69 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from models.oferta import Oferta, verificar_choques_conjunto
+
+_DIAS = ["seg", "ter", "qua", "qui", "sex"]
+
+
+def _hhmm(minutos):
+    return f"{minutos // 60:02d}:{minutos % 60:02d}"
+
+
+def _oferta_aleatoria(rng, oferta_id):
+    # Passo de 60 min: inícios iguais e intervalos encostados são frequentes
+    horarios = {}
+    for dia in rng.sample(_DIAS, rng.randint(1, 2)):
+        inicio = rng.randrange(6 * 60, 21 * 60, 60)
+        fim = min(inicio + rng.choice([60, 120]), 22 * 60)
+        horarios[dia] = f"{_hhmm(inicio)}-{_hhmm(fim)}"
+    return Oferta(oferta_id, "2025.1", horarios, 30)
+
+
+def _tem_choque_par_a_par(ofertas):
+    return any(a.verificar_choque_com_oferta(b) for a, b in combinations(ofertas, 2))
+
+
+def _assert_igual_par_a_par(ofertas):
+    par = verificar_choques_conjunto(ofertas)
+    assert (par is not None) == _tem_choque_par_a_par(ofertas)
+    if par is not None:
+        a, b = par
+        assert a is not b
+        assert a.verificar_choque_com_oferta(b)
+
+
+@pytest.mark.parametrize("semente", range(200))
+def test_verificar_choques_conjunto_igual_a_par_a_par(semente):
+    rng = random.Random(semente)
+    ofertas = [_oferta_aleatoria(rng, f"O{i}") for i in range(rng.randint(0, 8))]
+
+    _assert_igual_par_a_par(ofertas)
+
+
+def test_verificar_choques_conjunto_inicios_iguais():
+    a = Oferta("A", "2025.1", {"seg": "08:00-10:00"}, 30)
+    b = Oferta("B", "2025.1", {"seg": "08:00-09:00"}, 30)
+
+    _assert_igual_par_a_par([a, b])
+    _assert_igual_par_a_par([b, a])
+    assert verificar_choques_conjunto([a, b]) is not None
+
+
+def test_verificar_choques_conjunto_intervalos_encostados():
+    ofertas = [
+        Oferta("A", "2025.1", {"seg": "08:00-10:00"}, 30),
+        Oferta("B", "2025.1", {"seg": "10:00-12:00"}, 30),
+        Oferta("C", "2025.1", {"seg": "12:00-14:00", "ter": "08:00-10:00"}, 30),
+        Oferta("D", "2025.1", {"ter": "06:00-08:00"}, 30),
+    ]
+
+    assert verificar_choques_conjunto(ofertas) is None
+    _assert_igual_par_a_par(ofertas)
+
+    # Um intervalo longo antes de um encostado ainda choca com o seguinte
+    ofertas.append(Oferta("E", "2025.1", {"seg": "09:00-13:00"}, 30))
+    _assert_igual_par_a_par(ofertas)
+    assert verificar_choques_conjunto(ofertas) is not None
@@ -0,0 +1,126 @@
+import pytest
+
+from models.aluno import Aluno
+from repositories.aluno_repository import AlunoRepository
+from schemas.aluno_schema import AlunoSchema
+from services.aluno_service import AlunoService
+
+
+def _registro(codigo_curso, nota, carga_horaria=60, situacao="APROVADO"):
+    return {
+        "codigo_curso": codigo_curso,
+        "nota": nota,
+        "frequencia": 90,
+        "carga_horaria": carga_horaria,
+        "situacao": situacao,
+        "semestre": "2024.1",
+    }
+
+
+def _aluno_schema(historico):
+    return AlunoSchema(matricula="A1", nome="Ana", email="ana@email.com", historico=historico)
+
+
+def test_lote_com_registro_invalido_nao_altera_o_historico():
+    aluno = Aluno("A1", "Ana", "ana@email.com")
+    aluno.adicionar_ao_historico("C1", 8.0, 90, 60, "APROVADO")
+
+    with pytest.raises(ValueError):
+        aluno.adicionar_ao_historico_lote([_registro("C2", 7.0), _registro("C3", 11.0)])
+
+    assert [r["codigo_curso"] for r in aluno.historico] == ["C1"]
+    assert aluno.cr == 8.0
+
+
+def test_criar_aluno_com_registro_invalido_nao_grava_nada(cursos_no_banco):
+    service = AlunoService()
+
+    with pytest.raises(ValueError):
+        service.criar_aluno(_aluno_schema([_registro("C1", 8.0), _registro("C2", 11.0)]))
+
+    repo = AlunoRepository()
+    assert not repo.existe_matricula("A1")
+    assert repo.buscar_historico_aluno("A1") == []
+
+
+def test_criar_aluno_desfaz_o_aluno_se_o_historico_falhar_no_banco(cursos_no_banco):
+    service = AlunoService()
+
+    # Válido para o modelo, mas viola a FK de curso: o INSERT do aluno,
+    # feito antes na mesma transação, também é desfeito
+    with pytest.raises(ValueError):
+        service.criar_aluno(_aluno_schema([_registro("C1", 8.0), _registro("NAO_EXISTE", 7.0)]))
+
+    repo = AlunoRepository()
+    assert not repo.existe_matricula("A1")
+    assert repo.buscar_historico_aluno("A1") == []
+
+
+def test_criar_aluno_grava_aluno_e_historico(cursos_no_banco):
+    registros = [
+        _registro("C1", 8.0),
+        _registro("C2", 5.0, carga_horaria=30, situacao="REPROVADO_POR_NOTA"),
+        _registro("C3", 9.0, situacao="CURSANDO"),
+    ]
+
+    AlunoService().criar_aluno(_aluno_schema(registros))
+
+    salvo = AlunoRepository().buscar_por_matricula("A1")
+    assert salvo is not None
+    assert sorted(r["codigo_curso"] for r in salvo.historico) == ["C1", "C2", "C3"]
+
+
+def test_criar_aluno_cr_retornado_e_gravado_iguais_ao_calculado(cursos_no_banco):
+    registros = [
+        _registro("C1", 7.125),
+        _registro("C2", 5.5, carga_horaria=30, situacao="REPROVADO_POR_NOTA"),
+        _registro("C3", 2.0, situacao="REPROVADO_POR_FREQUENCIA"),
+    ]
+
+    aluno = AlunoService().criar_aluno(_aluno_schema(registros))
+
+    esperado = Aluno("A1", "Ana", "ana@email.com", historico=[dict(r) for r in registros]).calcular_cr()
+    assert aluno.cr == esperado
+    assert AlunoRepository().buscar_por_matricula("A1").cr == esperado
+
+
+def test_listar_alunos_usa_o_cr_gravado(cursos_no_banco):
+    service = AlunoService()
+    service.criar_aluno(_aluno_schema([_registro("C1", 6.0)]))
+    service.criar_aluno(AlunoSchema(matricula="B2", nome="Bia", email="bia@email.com",
+                                    historico=[_registro("C1", 9.0)]))
+
+    alunos = service.listar_alunos(ordenar_por_cr=True)
+
+    assert [(a.matricula, a.cr) for a in alunos] == [("B2", 9.0), ("A1", 6.0)]
+
+
+def test_criar_aluno_com_historico_calcula_o_cr_no_lugar_do_informado(cursos_no_banco):
+    schema = AlunoSchema(matricula="A1", nome="Ana", email="ana@email.com", cr=2.0,
+                         historico=[_registro("C1", 8.0), _registro("C2", 6.0, carga_horaria=30)])
+
+    aluno = AlunoService().criar_aluno(schema)
+
+    esperado = round((8.0 * 60 + 6.0 * 30) / 90, 2)
+    assert aluno.cr == esperado
+    assert AlunoRepository().buscar_por_matricula("A1").cr == esperado
+
+
+def test_criar_aluno_sem_historico_mantem_o_cr_informado(cursos_no_banco):
+    schema = AlunoSchema(matricula="A1", nome="Ana", email="ana@email.com", cr=6.5)
+
+    aluno = AlunoService().criar_aluno(schema)
+
+    assert aluno.cr == 6.5
+    assert AlunoRepository().buscar_por_matricula("A1").cr == 6.5
+
+
+def test_criar_aluno_grava_o_historico_normalizado(cursos_no_banco):
+    registro = _registro("C1", 8, situacao="aprovado")
+
+    AlunoService().criar_aluno(_aluno_schema([registro]))
+
+    salvo = AlunoRepository().buscar_historico_aluno("A1")[0]
+    assert salvo["situacao"] == "APROVADO"
+    assert salvo["nota"] == 8.0
+    assert salvo["data_registro"]
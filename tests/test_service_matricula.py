@@ -1,3 +1,5 @@
+from fractions import Fraction
+
 from repositories.aluno_repository import AlunoRepository
 from repositories.curso_repository import CursoRepository
 from repositories.matricula_repository import MatriculaRepository
@@ -32,3 +34,20 @@ def test_matricular_integracao():
     assert repo_mat.buscar_por_aluno_e_turma("2025001", "TU1") == True
     assert matricula.aluno.matricula == '2025001'
     
+
+
+def test_taxa_conclusao_usa_o_calculo_inteiro():
+    service = MatriculaService()
+
+    assert service._calcular_taxa_conclusao(0, 0) == 0.0
+    assert service._calcular_taxa_conclusao(3, 2) == 33.33
+    assert service._calcular_taxa_conclusao(3, 1) == 66.67
+    assert service._calcular_taxa_conclusao(4, 0) == 100.0
+    # 0,125%: o empate arredonda para cima, como a taxa de aprovação
+    assert service._calcular_taxa_conclusao(800, 799) == 0.13
+    for total in range(1, 200):
+        for ativas in range(total + 1):
+            # Percentual exato arredondado ao centésimo, empate para cima
+            centesimos = Fraction((total - ativas) * 10000, total)
+            esperado = int(centesimos + Fraction(1, 2)) / 100
+            assert service._calcular_taxa_conclusao(total, ativas) == esperado